@@ -0,0 +1,75 @@
+"""Concurrent-connection throughput of sync vs gevent gunicorn workers on catalog/dashboard reads.
+
+    python -m bench.bench_concurrency --database-url mysql+pymysql://... \\
+        [--workers 1] [--concurrency 64] [--duration 20]
+
+Starts gunicorn once per SERVER_MODE on a local port, then drives the
+courses and dashboard scenarios from bench.runner over HTTP. Use a
+networked database (MySQL/Postgres) seeded by bench.datagen: SQLite's file
+locking hides the I/O wait that gevent overlaps.
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url + "/api/health", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not come up")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--courses", type=int, default=1_000)
+    args = parser.parse_args()
+
+    for mode in ("sync", "gevent"):
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        env = dict(os.environ, DATABASE_URL=args.database_url, SERVER_MODE=mode,
+                   WEB_CONCURRENCY=str(args.workers), DB_POOL_SIZE=str(max(args.concurrency, 5)))
+        server = subprocess.Popen(["gunicorn", "--bind", f"127.0.0.1:{port}", "app:app"], cwd=ROOT, env=env)
+        try:
+            _wait_ready(url)
+            print(f"── SERVER_MODE={mode}, {args.workers} worker(s), {args.concurrency} connections")
+            subprocess.run([
+                sys.executable, "-m", "bench.runner", "--url", url,
+                "--database-url", args.database_url,
+                "--blueprint", "courses", "--blueprint", "dashboard",
+                "--scenario", "courses.list", "--scenario", "courses.list_category",
+                "--scenario", "courses.search", "--scenario", "courses.my_enrolled",
+                "--scenario", "dashboard.stats", "--scenario", "dashboard.summary",
+                "--concurrency", str(args.concurrency), "--duration", str(args.duration),
+                "--users", str(args.users), "--courses", str(args.courses),
+                "--output", os.path.join(ROOT, "bench", "results", f"concurrency-{mode}.json"),
+            ], cwd=ROOT, check=True)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""/api/auth/login throughput and latency with bcrypt inline vs. in the hashing pool.
+
+    python -m bench.bench_login [--concurrency 16] [--requests 400] [--workers 4]
+
+Runs against a throwaway SQLite file through Flask's test client, with one
+thread per simulated client standing in for gunicorn worker threads.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench_login.db")
+
+from app import app  # noqa: E402  (reads DATABASE_URL at import)
+from commands import init_db  # noqa: E402
+from models.models import db, User  # noqa: E402
+from routes.auth import hash_password  # noqa: E402
+from services.hashing import password_hasher  # noqa: E402
+
+EMAIL, PASSWORD = "bench@example.com", "bench-password"
+
+
+def run(concurrency, total):
+    def login(_):
+        start = time.perf_counter()
+        with app.test_client() as client:
+            status = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD}).status_code
+        return status, (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(login, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [ms for status, ms in results if status == 200]
+    q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+    return {
+        "ok":       len(latencies),
+        "rejected": sum(1 for status, _ in results if status == 503),
+        "rps":      round(len(latencies) / elapsed, 1),
+        "p50_ms":   round(q[49], 1),
+        "p99_ms":   round(q[98], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    init_db(app)
+    with app.app_context():
+        if not User.query.filter_by(email=EMAIL).first():
+            db.session.add(User(first_name="Bench", last_name="User", email=EMAIL,
+                                password_hash=hash_password(PASSWORD)))
+            db.session.commit()
+
+    for label, workers in (("inline", 0), (f"pool x{args.workers}", args.workers)):
+        password_hasher.workers  = workers
+        password_hasher.capacity = max(workers * 2, 1)
+        password_hasher._pid     = None  # rebuild the pool with this size
+        print(f"{label:>10}: {run(args.concurrency, args.requests)}")
+
+
+if __name__ == "__main__":
+    main()
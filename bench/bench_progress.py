@@ -0,0 +1,87 @@
+"""Heartbeat throughput and DB write volume: synchronous vs buffered progress updates.
+
+    python -m bench.bench_progress [--learners 200] [--beats 20] [--concurrency 16]
+
+Each learner sends `beats` PUT /api/courses/<id>/progress heartbeats with
+increasing time_spent_minutes. Reports handled requests/sec and the number
+of UPDATE statements that reached the database.
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench_progress.db")
+
+from flask_jwt_extended import create_access_token  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app import app  # noqa: E402
+from commands import init_db  # noqa: E402
+from models.models import db, User, Course, Enrollment  # noqa: E402
+from services.progress_buffer import progress_buffer  # noqa: E402
+
+updates = {"n": 0}
+
+
+def count_updates(conn, cursor, statement, parameters, context, executemany):
+    if statement.lstrip().upper().startswith("UPDATE"):
+        updates["n"] += len(parameters) if executemany else 1
+
+
+def setup(learners):
+    with app.app_context():
+        course = Course.query.first()
+        tokens = []
+        for i in range(learners):
+            email = f"learner{i}@bench.local"
+            user = User.query.filter_by(email=email).first()
+            if user is None:
+                user = User(first_name="L", last_name=str(i), email=email, password_hash="x")
+                db.session.add(user)
+                db.session.flush()
+                db.session.add(Enrollment(user_id=user.id, course_id=course.id))
+            tokens.append(create_access_token(identity=str(user.id)))
+        db.session.commit()
+        event.listen(db.engine, "before_cursor_execute", count_updates)
+        return course.id, tokens
+
+
+def run(course_id, tokens, beats, concurrency):
+    def learner(token):
+        with app.test_client() as client:
+            for beat in range(beats):
+                client.put(f"/api/courses/{course_id}/progress",
+                           json={"time_spent_minutes": beat, "lessons_completed": 1},
+                           headers={"Authorization": f"Bearer {token}"})
+
+    updates["n"] = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(learner, tokens))
+    elapsed = time.perf_counter() - start
+    if progress_buffer.enabled:
+        with app.app_context():
+            progress_buffer.flush()
+    total = len(tokens) * beats
+    return {"requests": total, "rps": round(total / elapsed, 1), "db_updates": updates["n"]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--learners", type=int, default=200)
+    parser.add_argument("--beats", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    init_db(app)
+    course_id, tokens = setup(args.learners)
+    for enabled in (False, True):
+        progress_buffer.enabled = enabled
+        label = "buffered" if enabled else "sync"
+        print(f"{label:>9}: {run(course_id, tokens, args.beats, args.concurrency)}")
+
+
+if __name__ == "__main__":
+    main()
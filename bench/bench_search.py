@@ -0,0 +1,54 @@
+"""Search latency vs. catalog size for the in-process inverted index.
+
+    python -m bench.bench_search [--sizes 1000,10000,100000] [--queries 500]
+
+MySQL FULLTEXT / Postgres GIN latency depends on the server; run the API
+load suite against those databases for end-to-end numbers.
+"""
+import argparse
+import random
+import statistics
+import time
+
+from services.search import InvertedIndex
+
+WORDS = ("python data science cloud aws design react next machine learning web "
+         "marketing analytics power bi full stack bootcamp complete masterclass "
+         "intro advanced kubernetes docker rust golang security networking").split()
+NAMES = "chen rivera sharma park wilson santos bradley horner nguyen okafor".split()
+
+
+def synthetic_rows(n, rng):
+    for i in range(1, n + 1):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 6)))
+        yield i, title, f"{rng.choice(NAMES).title()} {rng.choice(NAMES).title()}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    terms = [" ".join(rng.sample(WORDS, rng.randint(1, 2))) for _ in range(args.queries)]
+    terms += [w[:3] for w in rng.sample(WORDS, 10)]  # prefix queries
+
+    print(f"{'courses':>8} {'build ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        index = InvertedIndex()
+        start = time.perf_counter()
+        index.build(synthetic_rows(size, rng))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        samples = []
+        for term in terms:
+            start = time.perf_counter()
+            index.search(term)
+            samples.append((time.perf_counter() - start) * 1000)
+        q = statistics.quantiles(samples, n=100)
+        print(f"{size:>8} {build_ms:>9.1f} {q[49]:>8.3f} {q[94]:>8.3f} {q[98]:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
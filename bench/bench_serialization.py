@@ -0,0 +1,76 @@
+"""Response build time for catalog and enrollment lists: to_dict + jsonify vs. cached fragments.
+
+    python -m bench.bench_serialization [--sizes 1000,10000] [--repeat 5]
+
+Objects are built in memory (no database round-trips), so the numbers isolate
+serialization cost. "warm" reuses fragments from the previous build, which is
+the steady state between catalog changes.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench_serialization.db")
+
+from flask import jsonify  # noqa: E402
+
+from app import app  # noqa: E402
+from models.models import Course, Enrollment  # noqa: E402
+from services.serialization import fragments  # noqa: E402
+
+
+def make_objects(n):
+    now = datetime.now(timezone.utc)
+    courses = [
+        Course(id=i, title=f"Course {i}", slug=f"course-{i}", instructor="Bench", category="tech",
+               tag="Bench", emoji="🐍", level="Beginner", price=Decimal("89.00"),
+               original_price=Decimal("149.00"), total_lessons=48, total_hours=32,
+               rating=4.8, review_count=i)
+        for i in range(1, n + 1)
+    ]
+    enrollments = [
+        Enrollment(id=i, user_id=1, course_id=c.id, course=c, lessons_completed=3,
+                   progress_percent=6.2, time_spent_minutes=40, enrolled_at=now)
+        for i, c in enumerate(courses, 1)
+    ]
+    return courses, enrollments
+
+
+def best_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        for n in (int(s) for s in args.sizes.split(",")):
+            courses, enrollments = make_objects(n)
+            for fast in (False, True):
+                fragments.use_orjson = fast
+                fragments._fragments.clear()
+                catalog = lambda: fragments.document(courses=fragments.array(map(fragments.course, courses)))  # noqa: E731
+                mine = lambda: fragments.document(enrollments=fragments.array(map(fragments.enrollment, enrollments)))  # noqa: E731
+                row = {
+                    "list_courses jsonify": best_ms(lambda: jsonify({"courses": [c.to_dict() for c in courses]}), args.repeat),
+                    "list_courses cold":    best_ms(lambda: (fragments._fragments.clear(), catalog()), args.repeat),
+                    "list_courses warm":    best_ms(catalog, args.repeat),
+                    "my_courses jsonify":   best_ms(lambda: jsonify({"enrollments": [e.to_dict() for e in enrollments]}), args.repeat),
+                    "my_courses warm":      best_ms(mine, args.repeat),
+                }
+                print(f"n={n} encoder={'orjson' if fast else 'json'}: {row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Worker boot cost: time to import the app, and proof that it touches no database.
+
+    python -m bench.bench_startup [--runs 5]
+
+Each run imports `app` in a fresh interpreter with DATABASE_URL pointing at an
+unreachable MySQL host. Import must succeed quickly and open zero connections;
+schema work belongs to `flask --app app init-db`.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import time
+start = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+connects = []
+event.listen(Pool, "connect", lambda *a: connects.append(1))
+import app
+print(round((time.perf_counter() - start) * 1000, 1), len(connects))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    env = dict(os.environ, DATABASE_URL="mysql+pymysql://nobody:x@10.255.255.1:3306/none")
+    timings = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True)
+        ms, connects = out.stdout.split()[-2:]
+        if int(connects):
+            sys.exit(f"app import opened {connects} database connection(s)")
+        timings.append(float(ms))
+    print(f"import app: median {statistics.median(timings)} ms, max {max(timings)} ms, 0 connections")
+
+
+if __name__ == "__main__":
+    main()
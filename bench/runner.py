@@ -0,0 +1,176 @@
+"""Run API scenarios concurrently and report throughput and p50/p95/p99 per scenario.
+
+    python -m bench.runner --database-url sqlite:///bench.db [--duration 30] [--concurrency 16]
+    python -m bench.runner --url http://127.0.0.1:8000 ...   # against a running server
+    python -m bench.runner ... --compare bench/results/<older>.json
+
+Seed the database with bench.datagen first. Results are written to
+bench/results/<git sha>-<timestamp>.json so runs can be diffed across commits.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from bench.scenarios import select
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _git_sha():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class InProcessClient:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, body, headers):
+        return self.client.open(path, method=method, json=body, headers=headers).status_code
+
+
+class HttpClient:
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method, path, body, headers):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                     headers=dict(headers, **({"Content-Type": "application/json"} if data else {})))
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                resp.read()
+                return resp.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+
+def _tokens(app, users, count, rng):
+    from flask_jwt_extended import create_access_token
+    with app.app_context():
+        return [create_access_token(identity=str(rng.randint(1, users))) for _ in range(count)]
+
+
+def _percentiles(samples):
+    if len(samples) < 2:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+    q = statistics.quantiles(samples, n=100)
+    return {"p50_ms": round(q[49], 2), "p95_ms": round(q[94], 2), "p99_ms": round(q[98], 2)}
+
+
+def run(args):
+    from app import app
+
+    rng = random.Random(args.seed)
+    scenarios = select(args.scenario, args.blueprint)
+    weights = [s.weight for s in scenarios]
+    tokens = _tokens(app, args.users, 256, rng)
+    samples = defaultdict(list)
+    statuses = defaultdict(lambda: defaultdict(int))
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker(seed):
+        client = HttpClient(args.url) if args.url else InProcessClient(app)
+        ctx = SimpleNamespace(rng=random.Random(seed), users=args.users, courses=args.courses)
+        while time.perf_counter() < deadline:
+            scenario = ctx.rng.choices(scenarios, weights)[0]
+            method, path, body, auth = scenario.build(ctx)
+            headers = {"Authorization": f"Bearer {ctx.rng.choice(tokens)}"} if auth else {}
+            start = time.perf_counter()
+            status = client.request(method, path, body, headers)
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                samples[scenario.name].append(elapsed)
+                statuses[scenario.name][status] += 1
+
+    threads = [threading.Thread(target=worker, args=(args.seed + i,)) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    report = {
+        "commit":      _git_sha(),
+        "timestamp":   datetime.now(timezone.utc).isoformat(),
+        "target":      args.url or "in-process",
+        "database":    app.config["SQLALCHEMY_DATABASE_URI"].split("@")[-1],
+        "python":      platform.python_version(),
+        "duration_s":  round(wall, 2),
+        "concurrency": args.concurrency,
+        "total_rps":   round(sum(len(v) for v in samples.values()) / wall, 1),
+        "scenarios":   {},
+    }
+    for name in sorted(samples):
+        report["scenarios"][name] = dict(
+            requests=len(samples[name]),
+            rps=round(len(samples[name]) / wall, 1),
+            statuses={str(k): v for k, v in sorted(statuses[name].items())},
+            **_percentiles(samples[name]),
+        )
+    return report
+
+
+def print_report(report, baseline=None):
+    print(f"commit {report['commit']}  {report['target']}  total {report['total_rps']} req/s")
+    print(f"{'scenario':<24}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}  statuses")
+    for name, row in report["scenarios"].items():
+        line = f"{name:<24}{row['rps']:>9}{row['p50_ms']!s:>9}{row['p95_ms']!s:>9}{row['p99_ms']!s:>9}  {row['statuses']}"
+        old = (baseline or {}).get("scenarios", {}).get(name)
+        if old and old.get("p95_ms") and row["p95_ms"]:
+            line += f"  p95 {100 * (row['p95_ms'] - old['p95_ms']) / old['p95_ms']:+.0f}% vs {baseline['commit']}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", help="database seeded by bench.datagen (in-process mode)")
+    parser.add_argument("--url", help="base URL of a running server instead of the in-process app")
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=10_000, help="scale used by bench.datagen")
+    parser.add_argument("--courses", type=int, default=1_000, help="scale used by bench.datagen")
+    parser.add_argument("--scenario", action="append", help="run only these scenarios")
+    parser.add_argument("--blueprint", action="append", help="run only these blueprints")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--compare", help="earlier results JSON to diff against")
+    parser.add_argument("--output", help="results path (default: bench/results/<sha>-<time>.json)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    # Load tests would otherwise trip the contact form limiter immediately.
+    os.environ.setdefault("CONTACT_RATE_LIMIT", str(10**9))
+
+    report = run(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    path = args.output or os.path.join(
+        RESULTS_DIR, f"{report['commit']}-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
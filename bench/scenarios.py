@@ -0,0 +1,60 @@
+"""Request scenarios for the load runner, one or more per API blueprint.
+
+Each scenario is a callable taking a `ctx` (random source, auth tokens, scale)
+and returning (method, path, json_body, needs_auth).
+"""
+from collections import namedtuple
+
+Scenario = namedtuple("Scenario", "name blueprint weight build")
+
+PASSWORD = "bench-password"
+
+
+def _course(ctx):
+    return ctx.rng.randint(1, ctx.courses)
+
+
+SCENARIOS = [
+    # auth_bp
+    Scenario("auth.login", "auth", 1, lambda ctx: (
+        "POST", "/api/auth/login",
+        {"email": f"user{ctx.rng.randint(1, ctx.users)}@bench.local", "password": PASSWORD}, False)),
+    Scenario("auth.me", "auth", 3, lambda ctx: ("GET", "/api/auth/me", None, True)),
+
+    # courses_bp
+    Scenario("courses.list", "courses", 10, lambda ctx: (
+        "GET", f"/api/courses/?sort={ctx.rng.choice(['popular', 'newest', 'rating', 'price-lo'])}"
+               f"&page={ctx.rng.randint(1, 5)}", None, False)),
+    Scenario("courses.list_category", "courses", 4, lambda ctx: (
+        "GET", f"/api/courses/?category={ctx.rng.choice(['tech', 'cloud', 'design', 'data'])}", None, False)),
+    Scenario("courses.search", "courses", 3, lambda ctx: (
+        "GET", f"/api/courses/?search={ctx.rng.choice(['fundamentals', 'tech', 'data', 'instructor 4'])}", None, False)),
+    Scenario("courses.cursor", "courses", 2, lambda ctx: ("GET", "/api/courses/?cursor=&per_page=24", None, False)),
+    Scenario("courses.deep_page", "courses", 1, lambda ctx: (
+        "GET", f"/api/courses/?page={ctx.rng.randint(50, 400)}", None, False)),
+    Scenario("courses.my_enrolled", "courses", 4, lambda ctx: ("GET", "/api/courses/my/enrolled", None, True)),
+    Scenario("courses.enroll", "courses", 1, lambda ctx: (
+        "POST", f"/api/courses/{_course(ctx)}/enroll", None, True)),
+    Scenario("courses.progress", "courses", 6, lambda ctx: (
+        "PUT", f"/api/courses/{_course(ctx)}/progress",
+        {"lessons_completed": ctx.rng.randint(0, 5), "time_spent_minutes": ctx.rng.randint(0, 600)}, True)),
+
+    # dashboard_bp
+    Scenario("dashboard.stats", "dashboard", 3, lambda ctx: ("GET", "/api/dashboard/stats", None, True)),
+    Scenario("dashboard.summary", "dashboard", 3, lambda ctx: ("GET", "/api/dashboard/summary", None, True)),
+
+    # contact_bp
+    Scenario("contact.send", "contact", 1, lambda ctx: (
+        "POST", "/api/contact/",
+        {"first_name": "Load", "last_name": "Test", "email": f"load{ctx.rng.randint(1, 10**9)}@bench.local",
+         "topic": "General", "message": "Benchmark submission"}, False)),
+]
+
+
+def select(names=None, blueprints=None):
+    chosen = SCENARIOS
+    if names:
+        chosen = [s for s in chosen if s.name in names]
+    if blueprints:
+        chosen = [s for s in chosen if s.blueprint in blueprints]
+    return chosen
@@ -0,0 +1,126 @@
+import json
+from functools import wraps
+
+import click
+from flask import current_app
+
+from models.models import db, Course
+from services import counters, db_pool
+from services.bulk_enroll import import_enrollments, read_rows
+from services.catalog_cache import catalog_cache
+from services.export import EXPORTS, FORMATS, default_until, open_export, parse_watermark
+
+DEMO_COURSES = [
+    dict(title="Python for Data Science & AI", slug="python-data-science-ai",
+         instructor="Dr. Sarah Chen", category="tech", tag="Python", emoji="🐍",
+         level="Beginner", price=89, original_price=149,
+         total_lessons=48, total_hours=32, rating=4.9, review_count=8420),
+    dict(title="AWS Solutions Architect 2026", slug="aws-solutions-architect",
+         instructor="Mark Rivera", category="cloud", tag="Cloud", emoji="☁️",
+         level="Intermediate", price=119, original_price=189,
+         total_lessons=62, total_hours=45, rating=4.8, review_count=6130),
+    dict(title="UI/UX Design Bootcamp", slug="ui-ux-design-bootcamp",
+         instructor="Priya Sharma", category="design", tag="Design", emoji="🎨",
+         level="All Levels", price=99, original_price=159,
+         total_lessons=55, total_hours=38, rating=4.9, review_count=12040),
+    dict(title="React & Next.js 15 Complete", slug="react-nextjs-complete",
+         instructor="Kevin Park", category="tech", tag="React", emoji="⚛️",
+         level="Intermediate", price=109, original_price=179,
+         total_lessons=72, total_hours=54, rating=4.8, review_count=9210),
+    dict(title="Business Analytics with Power BI", slug="business-analytics-power-bi",
+         instructor="Emma Wilson", category="data", tag="Data", emoji="📈",
+         level="Beginner", price=79, original_price=129,
+         total_lessons=40, total_hours=28, rating=4.7, review_count=4320),
+    dict(title="Machine Learning A-Z", slug="machine-learning-az",
+         instructor="Dr. Maria Santos", category="data", tag="ML", emoji="📊",
+         level="All Levels", price=99, original_price=169,
+         total_lessons=85, total_hours=62, rating=4.8, review_count=18200),
+    dict(title="Full Stack Web Dev Bootcamp", slug="full-stack-web-dev",
+         instructor="Tom Bradley", category="tech", tag="Full Stack", emoji="🖥️",
+         level="All Levels", price=149, original_price=249,
+         total_lessons=120, total_hours=90, rating=4.7, review_count=22100),
+    dict(title="Digital Marketing Masterclass", slug="digital-marketing-masterclass",
+         instructor="James Horner", category="marketing", tag="Marketing", emoji="📣",
+         level="Beginner", price=69, original_price=119,
+         total_lessons=44, total_hours=31, rating=4.6, review_count=5410),
+]
+
+
+def seed_courses(app):
+    with app.app_context():
+        if Course.query.count() > 0:
+            print("✅ Courses already seeded.")
+            return
+        db.session.execute(db.insert(Course), DEMO_COURSES)
+        db.session.commit()
+        catalog_cache.bump()  # bulk INSERT bypasses the ORM events
+        print(f"✅ Seeded {len(DEMO_COURSES)} courses.")
+
+def init_db(app):
+    """One-shot schema setup: create tables, apply pending migrations, seed the catalog."""
+    from models.migrations import run_migrations
+    with app.app_context():
+        db.session.execute(db.text("SELECT 1"))
+        db.create_all()
+        run_migrations()
+    seed_courses(app)
+    print("✅ Database initialized successfully.")
+
+
+def _unbounded(command):
+    # Maintenance commands outlive any web request; drop DB_READ_TIMEOUT for them.
+    @wraps(command)
+    def wrapper(*args, **kwargs):
+        db_pool.lift_statement_timeouts(db.engine)
+        return command(*args, **kwargs)
+    return wrapper
+
+def register_commands(app):
+    @app.cli.command("init-db")
+    @_unbounded
+    def init_db_command():
+        """Create tables, run migrations and seed courses. Run once per deploy, not per worker."""
+        try:
+            init_db(app)
+        except Exception as e:
+            raise click.ClickException(f"❌ Database initialization failed: {e}")
+
+    @app.cli.command("reconcile-counters")
+    @_unbounded
+    def reconcile_counters():
+        """Recompute course enrollment/completion/trending counters (run from cron)."""
+        rows = counters.reconcile()
+        catalog_cache.bump()
+        click.echo(f"✅ Reconciled counters for {rows} courses.")
+
+    @app.cli.command("bulk-enroll")
+    @click.argument("source", type=click.File("rb"))
+    @click.option("--format", "fmt", type=click.Choice(["csv", "ndjson"]), default=None,
+                  help="Defaults from the file extension.")
+    @click.option("--chunk-size", type=int, default=None)
+    @_unbounded
+    def bulk_enroll(source, fmt, chunk_size):
+        """Enroll users from a CSV/NDJSON of email, course_slug[, progress]; prints an NDJSON report."""
+        fmt = fmt or ("csv" if source.name.endswith(".csv") else "ndjson")
+        chunk_size = chunk_size or current_app.config["BULK_CHUNK_SIZE"]
+        for result in import_enrollments(read_rows(source, fmt), chunk_size):
+            click.echo(json.dumps(result))
+
+    @app.cli.command("export")
+    @click.argument("name", type=click.Choice(sorted(EXPORTS)))
+    @click.option("--format", "fmt", type=click.Choice(sorted(FORMATS)), default="ndjson")
+    @click.option("--since", default=None, help="ISO-8601 watermark; pass the previous run's until.")
+    @click.option("--until", default=None, help="ISO-8601; defaults to now minus EXPORT_LAG_SECONDS.")
+    @click.option("--output", "-o", type=click.File("w", encoding="utf-8"), default="-")
+    @_unbounded
+    def export(name, fmt, since, until, output):
+        """Stream an enrollments/certificates/contact_messages export; prints the next --since to stderr."""
+        try:
+            since = parse_watermark(since)
+            until = parse_watermark(until) or default_until(current_app.config["EXPORT_LAG_SECONDS"])
+        except ValueError:
+            raise click.BadParameter("since and until must be ISO-8601 timestamps.")
+        columns, result = open_export(name, since, until, current_app.config["EXPORT_BATCH_SIZE"])
+        for chunk in FORMATS[fmt][1](columns, result):
+            output.write(chunk)
+        click.echo(f"until={until.isoformat()}", err=True)
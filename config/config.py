@@ -3,6 +3,34 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+def engine_options(uri):
+    """SQLAlchemy engine options for `uri`, tuned from DB_POOL_* / DB_*_TIMEOUT env vars."""
+    if uri.startswith("sqlite"):
+        return {}
+    options = {
+        "pool_size":     int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow":  int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout":  int(os.getenv("DB_POOL_TIMEOUT", 10)),
+        # Keep below MySQL's wait_timeout so the server never closes a pooled connection first
+        "pool_recycle":  int(os.getenv("DB_POOL_RECYCLE", 280)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+    connect_timeout = int(os.getenv("DB_CONNECT_TIMEOUT", 5))
+    # Bounds web requests; CLI commands lift it (db_pool.lift_statement_timeouts)
+    read_timeout    = int(os.getenv("DB_READ_TIMEOUT", 30))
+    if uri.startswith("mysql"):
+        options["connect_args"] = {
+            "connect_timeout": connect_timeout,
+            "read_timeout":    read_timeout,
+            "write_timeout":   read_timeout,
+        }
+    elif uri.startswith("postgres"):
+        options["connect_args"] = {
+            "connect_timeout": connect_timeout,
+            "options":         f"-c statement_timeout={read_timeout * 1000}",
+        }
+    return options
+
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
     DEBUG = os.getenv("FLASK_DEBUG", "True").lower() == "true"
@@ -22,9 +50,88 @@ class Config:
         )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # "sync" (default) or "gevent"; must match the gunicorn worker class (gunicorn.conf.py)
+    SERVER_MODE = os.getenv("SERVER_MODE", "sync").lower()
+    # SQLALCHEMY_ENGINE_OPTIONS is built by services.db_pool.init_app from the final URI
+
+    # Read replicas for GET views marked read_only (comma-separated URLs); after a
+    # write, that user's reads stay on the primary for REPLICA_PIN_SECONDS
+    SQLALCHEMY_REPLICA_URIS = [u for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+    REPLICA_PIN_SECONDS     = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+    REPLICA_RETRY_SECONDS   = int(os.getenv("REPLICA_RETRY_SECONDS", 30))
+
+    # Shared secret for ops endpoints (/api/metrics, ...); unset disables them
+    OPERATOR_TOKEN = os.getenv("OPERATOR_TOKEN")
+
+    # Request/SQL instrumentation (off = no hooks installed); operators can profile a
+    # request with "X-Profile: 1" plus their X-Operator-Token
+    INSTRUMENTATION_ENABLED = os.getenv("INSTRUMENTATION_ENABLED", "false").lower() == "true"
+    SLOW_QUERY_MS           = int(os.getenv("SLOW_QUERY_MS", 200))
+    PROFILE_SAMPLE_RATE     = float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+    PROFILE_DIR             = os.getenv("PROFILE_DIR")  # default: <instance>/profiles
+    PROFILE_KEEP            = int(os.getenv("PROFILE_KEEP", 200))  # newest .prof files kept
+
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt-dev-secret")
     JWT_ACCESS_TOKEN_EXPIRES_HOURS = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES_HOURS", 24))
 
+    # Password hashing: bcrypt cost and the per-worker process pool (0 workers = inline)
+    BCRYPT_ROUNDS         = int(os.getenv("BCRYPT_ROUNDS", 12))
+    # Per gunicorn worker: split the cores across WEB_CONCURRENCY workers instead of each taking all
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS",
+                                          max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY", 2)))))
+    PASSWORD_HASH_QUEUE   = int(os.getenv("PASSWORD_HASH_QUEUE", 0))  # 0 = 2 x workers
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+
+    # Contact form: write-behind queue with a local spool, plus per-IP/email rate limiting
+    CONTACT_QUEUE_ENABLED  = os.getenv("CONTACT_QUEUE_ENABLED", "true").lower() == "true"
+    CONTACT_BATCH_SIZE     = int(os.getenv("CONTACT_BATCH_SIZE", 100))
+    CONTACT_FLUSH_INTERVAL = float(os.getenv("CONTACT_FLUSH_INTERVAL", 2.0))
+    CONTACT_SPOOL_DIR      = os.getenv("CONTACT_SPOOL_DIR")  # default: <instance>/spool
+    CONTACT_RATE_LIMIT     = int(os.getenv("CONTACT_RATE_LIMIT", 5))
+    CONTACT_RATE_WINDOW    = int(os.getenv("CONTACT_RATE_WINDOW", 600))
+
+    # Reverse proxies in front of the app (Render: 1); only their X-Forwarded-For hops are trusted
+    TRUSTED_PROXIES = int(os.getenv("TRUSTED_PROXIES", 1))
+
+    # Player heartbeats: coalesce PUT /progress in memory and flush in batches (opt-in)
+    PROGRESS_BUFFER_ENABLED = os.getenv("PROGRESS_BUFFER_ENABLED", "false").lower() == "true"
+    PROGRESS_FLUSH_INTERVAL = float(os.getenv("PROGRESS_FLUSH_INTERVAL", 5.0))
+
+    # Sliding window for Course.trending_score (recomputed by `flask reconcile-counters`)
+    TRENDING_WINDOW_DAYS = int(os.getenv("TRENDING_WINDOW_DAYS", 7))
+
+    # Rows per transaction for bulk enrollment imports
+    BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 1000))
+
+    # Rows fetched per server-side cursor round trip for /api/exports and `flask export`
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+    # Default export `until` trails the clock so in-flight transactions are not skipped
+    EXPORT_LAG_SECONDS = int(os.getenv("EXPORT_LAG_SECONDS", 60))
+
+    # How long /api/health/ready reuses its last database probe
+    READINESS_CACHE_SECONDS = float(os.getenv("READINESS_CACHE_SECONDS", 5))
+
+    # Must equal the server's innodb_ft_min_token_size; shorter search words use LIKE
+    MYSQL_FT_MIN_TOKEN_SIZE = int(os.getenv("MYSQL_FT_MIN_TOKEN_SIZE", 3))
+
+    # Hard cap on per_page for /api/courses/ so one request cannot pull the whole table
+    COURSES_MAX_PER_PAGE = int(os.getenv("COURSES_MAX_PER_PAGE", 100))
+
+    # Public catalog cache: "memory" (per-worker LRU), "redis" (shared) or "none"
+    CATALOG_CACHE_BACKEND = os.getenv("CATALOG_CACHE_BACKEND", "memory").lower()
+    CATALOG_CACHE_TTL     = int(os.getenv("CATALOG_CACHE_TTL", 60))
+    CATALOG_CACHE_SIZE    = int(os.getenv("CATALOG_CACHE_SIZE", 512))
+    REDIS_URL             = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # HTTP caching and compression of read endpoints
+    HTTP_PUBLIC_MAX_AGE = int(os.getenv("HTTP_PUBLIC_MAX_AGE", 60))
+    COMPRESS_RESPONSES  = os.getenv("COMPRESS_RESPONSES", "true").lower() == "true"
+    COMPRESS_MIN_SIZE   = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_LEVEL      = int(os.getenv("COMPRESS_LEVEL", 6))
+
+    # Encode pre-built JSON fragments with orjson when it is installed
+    JSON_FAST_ENCODER = os.getenv("JSON_FAST_ENCODER", "false").lower() == "true"
+
     ALLOWED_ORIGINS = os.getenv(
         "ALLOWED_ORIGINS",
         "http://localhost:5500,http://127.0.0.1:5500"
@@ -0,0 +1,10 @@
+import os
+
+# Loaded automatically by `gunicorn app:app` (see Procfile).
+# SERVER_MODE=gevent switches to cooperative workers that keep many requests in
+# flight per process; size DB_POOL_SIZE/DB_MAX_OVERFLOW for worker_connections.
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+
+if os.getenv("SERVER_MODE", "sync").lower() == "gevent":
+    worker_class       = "gevent"
+    worker_connections = int(os.getenv("GEVENT_WORKER_CONNECTIONS", 200))
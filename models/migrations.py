@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from sqlalchemy import inspect
+from models.models import db, User, Course, Enrollment, Certificate, ContactMessage, SEARCH_INDEX_DDL
+
+# Versioned, forward-only schema migrations. db.create_all() builds a fresh schema
+# with every index already declared on the models; migrations bring existing
+# databases up to date and must therefore be idempotent.
+
+schema_migrations = db.Table(
+    "schema_migrations",
+    db.Column("version",     db.Integer, primary_key=True, autoincrement=False),
+    db.Column("description", db.String(255), nullable=False),
+    db.Column("applied_at",  db.DateTime, nullable=False),
+)
+
+MIGRATIONS = []
+
+def migration(version, description):
+    def register(fn):
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return register
+
+def _create_index(conn, model, name):
+    index = next(ix for ix in model.__table__.indexes if ix.name == name)
+    index.create(conn, checkfirst=True)
+
+def _add_column(conn, model, name):
+    if any(col["name"] == name for col in inspect(conn).get_columns(model.__tablename__)):
+        return
+    column = model.__table__.c[name]
+    ddl = f"ALTER TABLE {model.__tablename__} ADD COLUMN {name} {column.type.compile(conn.dialect)}"
+    if not column.nullable:
+        ddl += f" NOT NULL DEFAULT {column.server_default.arg}"
+    conn.execute(db.text(ddl))
+
+def _has_index(conn, table, name):
+    return any(ix["name"] == name for ix in inspect(conn).get_indexes(table))
+
+@migration(1, "Composite indexes for catalog, certificate and contact queries; full-text search")
+def _hot_query_indexes(conn):
+    for name in ("ix_courses_pub_cat_popular", "ix_courses_pub_popular", "ix_courses_pub_newest",
+                 "ix_courses_pub_rating", "ix_courses_pub_price"):
+        _create_index(conn, Course, name)
+    _create_index(conn, Certificate, "ix_certificates_user_course")
+    _create_index(conn, ContactMessage, "ix_contact_created_read")
+
+    if conn.dialect.name in SEARCH_INDEX_DDL:
+        name, ddl = SEARCH_INDEX_DDL[conn.dialect.name]
+        if not _has_index(conn, "courses", name):
+            conn.execute(db.text(ddl))
+
+@migration(2, "Denormalized course popularity counters")
+def _course_counters(conn):
+    from services.counters import reconcile
+    for name in ("enrollment_count", "completion_count", "trending_score"):
+        _add_column(conn, Course, name)
+    for name in ("ix_courses_pub_enrolled", "ix_courses_pub_trending"):
+        _create_index(conn, Course, name)
+    _create_index(conn, Enrollment, "ix_enrollments_course_enrolled")
+    reconcile(conn)
+
+@migration(3, "Watermark indexes for incremental exports")
+def _export_watermarks(conn):
+    _create_index(conn, Enrollment, "ix_enrollments_enrolled_at")
+    _create_index(conn, Certificate, "ix_certificates_issued_at")
+
+@migration(4, "Microsecond enrollments.last_accessed_at for ETag validators")
+def _fractional_last_accessed(conn):
+    if conn.dialect.name == "mysql":
+        conn.execute(db.text("ALTER TABLE enrollments MODIFY last_accessed_at DATETIME(6) NULL"))
+
+@migration(5, "Insert-time watermark for contact message exports")
+def _contact_inserted_at(conn):
+    _add_column(conn, ContactMessage, "inserted_at")
+    conn.execute(db.text("UPDATE contact_messages SET inserted_at = created_at WHERE inserted_at IS NULL"))
+    _create_index(conn, ContactMessage, "ix_contact_inserted_at")
+
+@migration(6, "users.updated_at validator for /api/auth/me")
+def _user_updated_at(conn):
+    _add_column(conn, User, "updated_at")
+    conn.execute(db.text("UPDATE users SET updated_at = created_at WHERE updated_at IS NULL"))
+
+def applied_versions():
+    schema_migrations.create(db.engine, checkfirst=True)
+    with db.engine.connect() as conn:
+        return set(conn.scalars(db.select(schema_migrations.c.version)))
+
+def run_migrations():
+    applied = applied_versions()
+    for version, description, fn in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        with db.engine.begin() as conn:
+            fn(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, description=description,
+                applied_at=datetime.now(timezone.utc),
+            ))
+        print(f"✅ Applied migration {version}: {description}")
@@ -1,7 +1,20 @@
 from datetime import datetime, timezone
+from flask import g, has_app_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy.dialects import mysql
 
-db = SQLAlchemy()
+class RoutingSession(Session):
+    # Reads go to the replica a read_only view put on `g` (see services.replicas);
+    # flushes and everything outside such views use the primary.
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context():
+            replica = g.get("db_replica")
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 class User(db.Model):
     __tablename__ = "users"
@@ -16,6 +29,10 @@ class User(db.Model):
     plan          = db.Column(db.String(20), nullable=False, default="starter")
     is_active     = db.Column(db.Boolean, default=True)
     created_at    = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Validator for GET /api/auth/me; microseconds so two edits in one second still differ
+    updated_at    = db.Column(db.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"), nullable=True,
+                              default=lambda: datetime.now(timezone.utc),
+                              onupdate=lambda: datetime.now(timezone.utc))
 
     enrollments  = db.relationship("Enrollment", back_populates="user", lazy="dynamic")
     certificates = db.relationship("Certificate", back_populates="user", lazy="dynamic")
@@ -37,6 +54,16 @@ class User(db.Model):
 
 class Course(db.Model):
     __tablename__ = "courses"
+    # One index per SORT_MAP order in routes.courses, with id as the keyset tiebreaker.
+    __table_args__ = (
+        db.Index("ix_courses_pub_cat_popular", "is_published", "category", "review_count", "id"),
+        db.Index("ix_courses_pub_popular", "is_published", "review_count", "id"),
+        db.Index("ix_courses_pub_newest",  "is_published", "created_at", "id"),
+        db.Index("ix_courses_pub_rating",  "is_published", "rating", "id"),
+        db.Index("ix_courses_pub_price",   "is_published", "price", "id"),
+        db.Index("ix_courses_pub_enrolled", "is_published", "enrollment_count", "id"),
+        db.Index("ix_courses_pub_trending", "is_published", "trending_score", "id"),
+    )
     id             = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title          = db.Column(db.String(255), nullable=False)
     slug           = db.Column(db.String(255), unique=True, nullable=False)
@@ -54,6 +81,10 @@ class Course(db.Model):
     review_count   = db.Column(db.Integer, default=0)
     is_published   = db.Column(db.Boolean, default=True)
     created_at     = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Denormalized counters, maintained by services.counters
+    enrollment_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    completion_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    trending_score   = db.Column(db.Float, nullable=False, default=0, server_default="0")
 
     enrollments  = db.relationship("Enrollment", back_populates="course", lazy="dynamic")
     certificates = db.relationship("Certificate", back_populates="course", lazy="dynamic")
@@ -75,11 +106,28 @@ class Course(db.Model):
             "total_hours":    self.total_hours,
             "rating":         self.rating,
             "review_count":   self.review_count,
+            "enrollment_count": self.enrollment_count,
+            "completion_count": self.completion_count,
         }
 
+# Full-text search indexes (see services.search); plain SQLite falls back to an in-process index.
+SEARCH_INDEX_DDL = {
+    "mysql": ("ft_courses_search",
+              "CREATE FULLTEXT INDEX ft_courses_search ON courses (title, instructor)"),
+    "postgresql": ("ix_courses_search",
+                   "CREATE INDEX ix_courses_search ON courses USING gin "
+                   "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(instructor, '')))"),
+}
+for _dialect, (_name, _ddl) in SEARCH_INDEX_DDL.items():
+    db.event.listen(Course.__table__, "after_create", db.DDL(_ddl).execute_if(dialect=_dialect))
+
 class Enrollment(db.Model):
     __tablename__ = "enrollments"
-    __table_args__ = (db.UniqueConstraint("user_id", "course_id", name="uq_user_course"),)
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "course_id", name="uq_user_course"),
+        db.Index("ix_enrollments_course_enrolled", "course_id", "enrolled_at"),
+        db.Index("ix_enrollments_enrolled_at", "enrolled_at", "id"),
+    )
     id                  = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id             = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     course_id           = db.Column(db.Integer, db.ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
@@ -88,25 +136,76 @@ class Enrollment(db.Model):
     last_lesson_index   = db.Column(db.Integer, default=0)
     time_spent_minutes  = db.Column(db.Integer, default=0)
     enrolled_at         = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    last_accessed_at    = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Microseconds on MySQL too: MAX(last_accessed_at) is part of Enrollment.fingerprint
+    last_accessed_at    = db.Column(db.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+                                    default=lambda: datetime.now(timezone.utc))
     completed_at        = db.Column(db.DateTime, nullable=True)
 
     user   = db.relationship("User", back_populates="enrollments")
     course = db.relationship("Course", back_populates="enrollments")
 
-    def to_dict(self):
+    @classmethod
+    def for_user(cls, user_id):
+        # Eager-load the course in the same SELECT so to_dict() never lazy-loads per row.
+        return cls.query.filter_by(user_id=user_id).options(db.joinedload(cls.course))
+
+    @classmethod
+    def summary_for(cls, user_id):
+        # One grouped SELECT; the certificate count rides along as a scalar subquery.
+        certificates = (
+            db.select(db.func.count(Certificate.id))
+            .where(Certificate.user_id == user_id)
+            .scalar_subquery()
+        )
+        row = db.session.execute(
+            db.select(
+                db.func.count(cls.id).label("enrolled"),
+                db.func.count(cls.completed_at).label("completed"),
+                db.func.coalesce(db.func.sum(cls.time_spent_minutes), 0).label("minutes"),
+                certificates.label("certificates"),
+            ).where(cls.user_id == user_id)
+        ).one()
         return {
+            "courses_enrolled":    row.enrolled,
+            "courses_completed":   row.completed,
+            "certificates_earned": row.certificates,
+            # MySQL returns SUM() as Decimal, which jsonify would render as a string
+            "total_hours":         round(int(row.minutes) / 60, 1),
+        }
+
+    @classmethod
+    def fingerprint(cls, user_id):
+        # Cheap validator for per-user listings: changes whenever an enrollment or certificate does.
+        # Every progress write stamps last_accessed_at; sums would let offsetting edits collide.
+        certificates = db.select(Certificate.id).where(Certificate.user_id == user_id)
+        return tuple(db.session.execute(
+            db.select(
+                db.func.count(cls.id), db.func.max(cls.id),
+                db.func.max(cls.last_accessed_at), db.func.count(cls.completed_at),
+                db.select(db.func.count()).select_from(certificates.subquery()).scalar_subquery(),
+                certificates.order_by(Certificate.id.desc()).limit(1).scalar_subquery(),
+            ).where(cls.user_id == user_id)
+        ).one())
+
+    def to_dict(self, include_course=True):
+        data = {
             "id":                self.id,
-            "course":            self.course.to_dict() if self.course else None,
             "lessons_completed": self.lessons_completed,
             "progress_percent":  self.progress_percent,
             "time_spent_minutes":self.time_spent_minutes,
             "enrolled_at":       self.enrolled_at.isoformat() if self.enrolled_at else None,
             "completed_at":      self.completed_at.isoformat() if self.completed_at else None,
         }
+        if include_course:
+            data["course"] = self.course.to_dict() if self.course else None
+        return data
 
 class Certificate(db.Model):
     __tablename__ = "certificates"
+    __table_args__ = (
+        db.Index("ix_certificates_user_course", "user_id", "course_id"),
+        db.Index("ix_certificates_issued_at", "issued_at", "id"),
+    )
     id               = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id          = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     course_id        = db.Column(db.Integer, db.ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
@@ -116,6 +215,10 @@ class Certificate(db.Model):
     user   = db.relationship("User", back_populates="certificates")
     course = db.relationship("Course", back_populates="certificates")
 
+    @classmethod
+    def for_user(cls, user_id):
+        return cls.query.filter_by(user_id=user_id).options(db.joinedload(cls.course))
+
     def to_dict(self):
         return {
             "id":               self.id,
@@ -126,6 +229,10 @@ class Certificate(db.Model):
 
 class ContactMessage(db.Model):
     __tablename__ = "contact_messages"
+    __table_args__ = (
+        db.Index("ix_contact_created_read", "created_at", "is_read"),
+        db.Index("ix_contact_inserted_at", "inserted_at", "id"),
+    )
     id         = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id    = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     first_name = db.Column(db.String(80), nullable=False)
@@ -136,6 +243,8 @@ class ContactMessage(db.Model):
     message    = db.Column(db.Text, nullable=False)
     is_read    = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Stamped by the INSERT itself; the write-behind queue sets created_at at submission
+    inserted_at = db.Column(db.DateTime, nullable=True, default=lambda: datetime.now(timezone.utc))
 
     user = db.relationship("User", back_populates="contact_msgs")
 
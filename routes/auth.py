@@ -1,16 +1,22 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-import bcrypt
 from datetime import timedelta
 from models.models import db, User
+from services.hashing import password_hasher, HashingPoolSaturated
+from services.http_cache import conditional
+from services.replicas import read_only
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
 def hash_password(plain):
-    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt()).decode()
+    return password_hasher.hash(plain)
 
 def check_password(plain, hashed):
-    return bcrypt.checkpw(plain.encode(), hashed.encode())
+    return password_hasher.check(plain, hashed)
+
+@auth_bp.errorhandler(HashingPoolSaturated)
+def hashing_saturated(e):
+    return jsonify({"error": "Too many sign-in attempts right now. Please retry shortly."}), 503, {"Retry-After": "1"}
 
 @auth_bp.route("/register", methods=["POST"])
 def register():
@@ -50,11 +56,27 @@ def login():
     if not user or not check_password(password, user.password_hash):
         return jsonify({"error": "Invalid email or password."}), 401
 
+    # Upgrade hashes made with an older BCRYPT_ROUNDS; skipped if the pool is busy.
+    if password_hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = hash_password(password)
+            db.session.commit()
+        except HashingPoolSaturated:
+            pass
+
     token = create_access_token(identity=str(user.id), expires_delta=timedelta(hours=24))
     return jsonify({"message": "Login successful.", "token": token, "user": user.to_dict()}), 200
 
+def _me_validator():
+    user_id = int(get_jwt_identity())
+    return "me", user_id, db.session.execute(
+        db.select(User.updated_at).where(User.id == user_id)
+    ).scalar()
+
 @auth_bp.route("/me", methods=["GET"])
 @jwt_required()
+@read_only
+@conditional(_me_validator)
 def get_me():
     user = User.query.get_or_404(int(get_jwt_identity()))
     return jsonify({"user": user.to_dict()}), 200
@@ -1,7 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from models.models import db, ContactMessage
+from services.contact_queue import contact_queue
+from services.ratelimit import RateLimiter
 
 contact_bp = Blueprint("contact", __name__, url_prefix="/api/contact")
+limiter    = RateLimiter()
+
+def _rate_limited(email):
+    limit  = current_app.config["CONTACT_RATE_LIMIT"]
+    window = current_app.config["CONTACT_RATE_WINDOW"]
+    # Not access_route[0]: the leftmost X-Forwarded-For entry is client-controlled
+    return not limiter.allow(f"ip:{request.remote_addr}", f"email:{email.lower()}",
+                             limit=limit, window=window)
 
 @contact_bp.route("/", methods=["POST"])
 def send_message():
@@ -15,11 +25,17 @@ def send_message():
 
     if not all([first_name, email, message]):
         return jsonify({"error": "Please fill all required fields."}), 400
+    if _rate_limited(email):
+        return jsonify({"error": "Too many messages. Please try again later."}), 429
 
-    msg = ContactMessage(
+    fields = dict(
         first_name=first_name, last_name=last_name,
         email=email, company=company, topic=topic, message=message
     )
-    db.session.add(msg)
+    if contact_queue.enabled:
+        contact_queue.enqueue(fields)
+        return jsonify({"message": "Message received! We'll reply within 24h."}), 202
+
+    db.session.add(ContactMessage(**fields))
     db.session.commit()
     return jsonify({"message": "Message received! We'll reply within 24h."}), 201
\ No newline at end of file
@@ -1,43 +1,143 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.models import db, Course, Enrollment, Certificate
+from services import counters
+from services.bulk_enroll import import_enrollments, read_rows
+from services.catalog_cache import catalog_cache
+from services.http_cache import conditional
+from services.operator import operator_required
+from services.progress_buffer import progress_buffer
+from services.replicas import read_only
+from services.search import search_courses
+from services.serialization import fragments
 from datetime import datetime, timezone
+from decimal import Decimal
+import base64
+import json
 import uuid
 
 courses_bp = Blueprint("courses", __name__, url_prefix="/api/courses")
 
+# sort key -> (column, descending); `id` breaks ties so keyset pages are stable
+SORT_MAP = {
+    "popular":  (Course.review_count, True),
+    "newest":   (Course.created_at,   True),
+    "rating":   (Course.rating,       True),
+    "price-lo": (Course.price,        False),
+    "price-hi": (Course.price,        True),
+    "enrolled": (Course.enrollment_count, True),
+    "trending": (Course.trending_score,   True),
+}
+
+def _encode_cursor(sort, course):
+    column, _ = SORT_MAP[sort]
+    value = getattr(course, column.key)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps({"s": sort, "v": value, "i": course.id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(sort, cursor):
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if data["s"] != sort:
+            return None
+        column, _ = SORT_MAP[sort]
+        value = data["v"]
+        if isinstance(column.type, db.DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(column.type, db.Numeric) and not isinstance(column.type, db.Float):
+            value = Decimal(value)
+        return value, int(data["i"])
+    except (ValueError, KeyError, TypeError, ArithmeticError):  # Decimal("abc") -> InvalidOperation
+        return None
+
+def _after_cursor(query, sort, value, last_id):
+    column, descending = SORT_MAP[sort]
+    if descending:
+        return query.filter(db.or_(column < value, db.and_(column == value, Course.id < last_id)))
+    return query.filter(db.or_(column > value, db.and_(column == value, Course.id > last_id)))
+
+def _json_response(body, status=200):
+    return Response(body, status=status, mimetype="application/json")
+
+def _catalog_validator():
+    return "catalog", catalog_cache.validator(request.args.get("sort")), sorted(request.args.items(multi=True))
+
+def _my_courses_validator():
+    return "my_courses", Enrollment.fingerprint(int(get_jwt_identity()))
+
 @courses_bp.route("/", methods=["GET"])
+@read_only
+@conditional(_catalog_validator, scope="public")
 def list_courses():
     category = request.args.get("category", "")
     search   = request.args.get("search", "")
-    sort     = request.args.get("sort", "popular")
-    page     = int(request.args.get("page", 1))
+    sort     = request.args.get("sort", "relevance" if search else "popular")
+    page     = max(int(request.args.get("page", 1)), 1)
     per_page = int(request.args.get("per_page", 12))
+    per_page = min(max(per_page, 1), current_app.config["COURSES_MAX_PER_PAGE"])
+    cursor   = request.args.get("cursor")
+    with_total = request.args.get("include_total", "").lower() in ("1", "true")
+    # Relevance ordering has no stable keyset, so cursor mode keeps a SORT_MAP order.
+    if sort not in SORT_MAP and not (sort == "relevance" and search and cursor is None):
+        sort = "popular"
+
+    params = dict(category=category, search=search, sort=sort, page=page, per_page=per_page)
+    if cursor is not None:
+        params.update(cursor=cursor, include_total=with_total)
+    cached = catalog_cache.get(params)
+    if cached is not None:
+        return _json_response(cached)
 
     query = Course.query.filter_by(is_published=True)
     if category and category != "all":
         query = query.filter_by(category=category)
+    relevance = None
     if search:
-        like = f"%{search}%"
-        query = query.filter(db.or_(
-            Course.title.ilike(like), Course.instructor.ilike(like)
-        ))
+        query, relevance = search_courses(query, search)
 
-    sort_map = {
-        "popular":  Course.review_count.desc(),
-        "newest":   Course.created_at.desc(),
-        "rating":   Course.rating.desc(),
-        "price-lo": Course.price.asc(),
-        "price-hi": Course.price.desc(),
-    }
-    query = query.order_by(sort_map.get(sort, Course.review_count.desc()))
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-
-    return jsonify({
-        "courses":     [c.to_dict() for c in pagination.items],
-        "total":       pagination.total,
-        "total_pages": pagination.pages,
-    }), 200
+    if sort == "relevance" and relevance is not None:
+        order = (relevance.desc(), Course.id.desc())
+    else:
+        column, descending = SORT_MAP.get(sort, SORT_MAP["popular"])
+        order = (column.desc(), Course.id.desc()) if descending else (column.asc(), Course.id.asc())
+
+    if cursor is None:
+        pagination = query.order_by(*order).paginate(page=page, per_page=per_page, error_out=False)
+        body = fragments.document(
+            courses=fragments.array(fragments.course(c) for c in pagination.items),
+            total=pagination.total,
+            total_pages=pagination.pages,
+        )
+    else:
+        # Keyset mode: an empty cursor starts from the top, no OFFSET and no COUNT(*) by default.
+        total = query.order_by(None).count() if with_total else None
+        if cursor:
+            position = _decode_cursor(sort, cursor)
+            if position is None:
+                return jsonify({"error": "Invalid cursor."}), 400
+            query = _after_cursor(query, sort, *position)
+        rows = query.order_by(*order).limit(per_page + 1).all()
+        items = rows[:per_page]
+        parts = dict(
+            courses=fragments.array(fragments.course(c) for c in items),
+            next_cursor=_encode_cursor(sort, items[-1]) if len(rows) > per_page else None,
+        )
+        if with_total:
+            parts["total"] = total
+        body = fragments.document(**parts)
+
+    body = body.decode()
+    catalog_cache.set(params, body)
+    return _json_response(body)
+
+@courses_bp.route("/cache/stats", methods=["GET"])
+@operator_required
+def cache_stats():
+    return jsonify(catalog_cache.stats()), 200
 
 @courses_bp.route("/<int:course_id>/enroll", methods=["POST"])
 @jwt_required()
@@ -48,37 +148,74 @@ def enroll(course_id):
         return jsonify({"error": "Already enrolled."}), 409
     e = Enrollment(user_id=user_id, course_id=course_id)
     db.session.add(e)
+    counters.record_enrollments(course_id)
     db.session.commit()
     return jsonify({"message": f"Enrolled in {course.title}!", "enrollment": e.to_dict()}), 201
 
+@courses_bp.route("/bulk/enroll", methods=["POST"])
+@operator_required
+def bulk_enroll():
+    fmt = request.args.get("format") or ("csv" if request.mimetype == "text/csv" else "ndjson")
+    if fmt not in ("csv", "ndjson"):
+        return jsonify({"error": "format must be csv or ndjson."}), 400
+    rows    = read_rows(request.stream, fmt)
+    results = import_enrollments(rows, current_app.config["BULK_CHUNK_SIZE"])
+    body    = (json.dumps(result) + "\n" for result in results)
+    return Response(stream_with_context(body), mimetype="application/x-ndjson")
+
+def _issue_completion(e):
+    # Guarded UPDATE: only the request that flips completed_at from NULL issues the
+    # certificate, so concurrent heartbeats cannot complete a course twice.
+    flipped = db.session.execute(
+        db.update(Enrollment)
+        .where(Enrollment.id == e.id, Enrollment.completed_at.is_(None))
+        .values(completed_at=datetime.now(timezone.utc))
+    ).rowcount
+    if not flipped:
+        return
+    counters.record_completions(e.course_id)
+    if not Certificate.query.filter_by(user_id=e.user_id, course_id=e.course_id).first():
+        db.session.add(Certificate(
+            user_id=e.user_id, course_id=e.course_id,
+            certificate_code=f"NL-{uuid.uuid4().hex[:12].upper()}"
+        ))
+
 @courses_bp.route("/<int:course_id>/progress", methods=["PUT"])
 @jwt_required()
 def update_progress(course_id):
     user_id = int(get_jwt_identity())
     data    = request.get_json(silent=True) or {}
-    e       = Enrollment.query.filter_by(user_id=user_id, course_id=course_id).first_or_404()
+
+    if progress_buffer.enabled:
+        target = progress_buffer.lookup(user_id, course_id)
+        if target is None:
+            return jsonify({"error": "Not found."}), 404
+        queued, data = progress_buffer.absorb(target, data)
+        if queued is not None:
+            return jsonify({"message": "Progress queued.", "progress": queued}), 202
+
+    e = Enrollment.query.filter_by(user_id=user_id, course_id=course_id).first_or_404()
 
     if "lessons_completed" in data:
         e.lessons_completed = int(data["lessons_completed"])
     if "time_spent_minutes" in data:
         e.time_spent_minutes = int(data["time_spent_minutes"])
+    e.last_accessed_at = datetime.now(timezone.utc)
 
     if e.course.total_lessons:
         e.progress_percent = round((e.lessons_completed / e.course.total_lessons) * 100, 1)
 
     if e.progress_percent >= 100 and not e.completed_at:
-        e.completed_at = datetime.now(timezone.utc)
-        if not Certificate.query.filter_by(user_id=user_id, course_id=course_id).first():
-            db.session.add(Certificate(
-                user_id=user_id, course_id=course_id,
-                certificate_code=f"NL-{uuid.uuid4().hex[:12].upper()}"
-            ))
+        _issue_completion(e)
     db.session.commit()
     return jsonify({"message": "Progress updated.", "enrollment": e.to_dict()}), 200
 
 @courses_bp.route("/my/enrolled", methods=["GET"])
 @jwt_required()
+@read_only
+@conditional(_my_courses_validator)
 def my_courses():
     user_id     = int(get_jwt_identity())
-    enrollments = Enrollment.query.filter_by(user_id=user_id).all()
-    return jsonify({"enrollments": [e.to_dict() for e in enrollments]}), 200
\ No newline at end of file
+    enrollments = Enrollment.for_user(user_id).all()
+    body = fragments.document(enrollments=fragments.array(fragments.enrollment(e) for e in enrollments))
+    return _json_response(body)
\ No newline at end of file
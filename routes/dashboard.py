@@ -1,23 +1,39 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.models import Enrollment, Certificate
+from services.http_cache import conditional
+from services.replicas import read_only
+from services.serialization import fragments
 
 dashboard_bp = Blueprint("dashboard", __name__, url_prefix="/api/dashboard")
 
+def _stats_validator():
+    return "stats", Enrollment.fingerprint(int(get_jwt_identity()))
+
 @dashboard_bp.route("/stats", methods=["GET"])
 @jwt_required()
+@read_only
+@conditional(_stats_validator)
 def get_stats():
     user_id      = int(get_jwt_identity())
-    enrollments  = Enrollment.query.filter_by(user_id=user_id).all()
-    certificates = Certificate.query.filter_by(user_id=user_id).all()
+    enrollments  = Enrollment.for_user(user_id).all()
+    certificates = Certificate.for_user(user_id).all()
     total_time   = sum(e.time_spent_minutes for e in enrollments)
     completed    = [e for e in enrollments if e.completed_at]
 
-    return jsonify({
-        "courses_enrolled":    len(enrollments),
-        "courses_completed":   len(completed),
-        "certificates_earned": len(certificates),
-        "total_hours":         round(total_time / 60, 1),
-        "enrollments":         [e.to_dict() for e in enrollments],
-        "certificates":        [c.to_dict() for c in certificates],
-    }), 200
\ No newline at end of file
+    body = fragments.document(
+        courses_enrolled=len(enrollments),
+        courses_completed=len(completed),
+        certificates_earned=len(certificates),
+        total_hours=round(total_time / 60, 1),
+        enrollments=fragments.array(fragments.enrollment(e) for e in enrollments),
+        certificates=[c.to_dict() for c in certificates],
+    )
+    return Response(body, mimetype="application/json")
+
+@dashboard_bp.route("/summary", methods=["GET"])
+@jwt_required()
+@read_only
+def get_summary():
+    user_id = int(get_jwt_identity())
+    return jsonify(Enrollment.summary_for(user_id)), 200
\ No newline at end of file
@@ -0,0 +1,31 @@
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
+from services.export import EXPORTS, FORMATS, default_until, open_export, parse_watermark
+from services.operator import operator_required
+from services.replicas import read_only
+
+exports_bp = Blueprint("exports", __name__, url_prefix="/api/exports")
+
+@exports_bp.route("/<name>", methods=["GET"])
+@operator_required
+@read_only
+def export(name):
+    if name not in EXPORTS:
+        return jsonify({"error": "Not found."}), 404
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in FORMATS:
+        return jsonify({"error": "format must be csv or ndjson."}), 400
+    try:
+        since = parse_watermark(request.args.get("since"))
+        until = parse_watermark(request.args.get("until"))
+    except ValueError:
+        return jsonify({"error": "since and until must be ISO-8601 timestamps."}), 400
+    cfg   = current_app.config
+    until = until or default_until(cfg["EXPORT_LAG_SECONDS"])
+
+    columns, result   = open_export(name, since, until, cfg["EXPORT_BATCH_SIZE"])
+    mimetype, encoder = FORMATS[fmt]
+    response = Response(stream_with_context(encoder(columns, result)), mimetype=mimetype)
+    # Pass this back as ?since= on the next run to pull only newer rows.
+    response.headers["X-Export-Until"]      = until.isoformat()
+    response.headers["Content-Disposition"] = f'attachment; filename="{name}.{fmt}"'
+    return response
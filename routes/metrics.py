@@ -0,0 +1,20 @@
+from flask import Blueprint, Response, jsonify
+from services.instrumentation import instrumentation
+from services.metrics import metrics
+from services.operator import operator_required
+
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/api/metrics")
+
+@metrics_bp.route("", methods=["GET"])
+@operator_required
+def scrape():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@metrics_bp.route("/profiles/<name>", methods=["GET"])
+@operator_required
+def profile(name):
+    report = instrumentation.profile_report(name)
+    if report is None:
+        return jsonify({"error": "Not found."}), 404
+    return Response(report, mimetype="text/plain")
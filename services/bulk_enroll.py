@@ -0,0 +1,194 @@
+import csv
+import io
+import json
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.models import db, User, Course, Enrollment, Certificate
+from services import counters
+
+
+def read_rows(stream, fmt):
+    """Yield (line_no, row dict | None) from a CSV (header: email,course_slug[,progress])
+    or NDJSON byte stream without loading it whole; None marks an unparseable line."""
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if fmt == "csv":
+        for line_no, row in enumerate(csv.DictReader(text), start=2):
+            yield line_no, row
+        return
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_no, row if isinstance(row, dict) else None
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _parse(row):
+    # NDJSON rows carry any JSON type; only strings (and numeric progress) are valid.
+    email = row.get("email") or ""
+    slug  = row.get("course_slug") or row.get("slug") or ""
+    if not isinstance(email, str) or not isinstance(slug, str):
+        raise ValueError("email and course_slug must be strings")
+    email, slug = email.strip().lower(), slug.strip()
+    if not email or not slug:
+        raise ValueError("email and course_slug are required")
+    progress = row.get("progress")
+    if progress in (None, ""):
+        return email, slug, None
+    if isinstance(progress, bool) or not isinstance(progress, (str, int, float)):
+        raise ValueError("progress must be a number")
+    progress = float(progress)
+    if not 0 <= progress <= 100:
+        raise ValueError("progress must be between 0 and 100")
+    return email, slug, progress
+
+
+def _upsert(rows):
+    """One multi-row INSERT that enrolls new pairs and raises progress on existing ones."""
+    table   = Enrollment.__table__
+    dialect = db.engine.dialect.name
+    if dialect == "mysql":
+        stmt = mysql.insert(table).values(rows)
+        new, higher = stmt.inserted, db.func.greatest
+        return stmt.on_duplicate_key_update(**_merge(table, new, higher))
+    if dialect == "postgresql":
+        stmt = postgresql.insert(table).values(rows)
+        new, higher = stmt.excluded, db.func.greatest
+        return stmt.on_conflict_do_update(constraint="uq_user_course", set_=_merge(table, new, higher))
+    stmt = sqlite.insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "course_id"], set_=_merge(table, stmt.excluded, db.func.max)
+    )
+
+
+def _merge(table, new, higher):
+    return {
+        "lessons_completed": higher(table.c.lessons_completed, new.lessons_completed),
+        "progress_percent":  higher(table.c.progress_percent, new.progress_percent),
+        "completed_at":      db.func.coalesce(table.c.completed_at, new.completed_at),
+        "last_accessed_at":  new.last_accessed_at,
+    }
+
+
+def _process(chunk):
+    now     = datetime.now(timezone.utc)
+    report  = {}
+    parsed  = {}
+    for line_no, row in chunk:
+        try:
+            if row is None:
+                raise ValueError("unparseable row")
+            parsed[line_no] = _parse(row)
+        except (TypeError, ValueError) as e:
+            report[line_no] = {"line": line_no, "status": "invalid", "error": str(e)}
+
+    emails  = {email for email, _, _ in parsed.values()}
+    slugs   = {slug for _, slug, _ in parsed.values()}
+    users   = dict(db.session.execute(db.select(User.email, User.id).where(User.email.in_(emails))).all()) if emails else {}
+    courses = {row.slug: row for row in db.session.execute(
+        db.select(Course.slug, Course.id, Course.total_lessons).where(Course.slug.in_(slugs))
+    ).all()} if slugs else {}
+
+    wanted = {}
+    for line_no, (email, slug, progress) in parsed.items():
+        if email not in users:
+            report[line_no] = {"line": line_no, "status": "unknown_user", "email": email}
+        elif slug not in courses:
+            report[line_no] = {"line": line_no, "status": "unknown_course", "course_slug": slug}
+        elif (users[email], courses[slug].id) in wanted:
+            report[line_no] = {"line": line_no, "status": "duplicate", "email": email, "course_slug": slug}
+        else:
+            wanted[(users[email], courses[slug].id)] = (line_no, email, slug, progress)
+
+    existing = {}
+    if wanted:
+        existing = {(r.user_id, r.course_id): r.completed_at for r in db.session.execute(
+            db.select(Enrollment.user_id, Enrollment.course_id, Enrollment.completed_at).where(
+                Enrollment.user_id.in_({u for u, _ in wanted}),
+                Enrollment.course_id.in_({c for _, c in wanted}),
+            )
+        ).all() if (r.user_id, r.course_id) in wanted}
+
+    rows, enrolled, completed = [], Counter(), []
+    for (user_id, course_id), (line_no, email, slug, progress) in wanted.items():
+        total = courses[slug].total_lessons or 0
+        done  = progress is not None and progress >= 100
+        rows.append(dict(
+            user_id=user_id, course_id=course_id,
+            lessons_completed=round(total * (progress or 0) / 100),
+            progress_percent=round(progress or 0, 1),
+            enrolled_at=now, last_accessed_at=now,
+            completed_at=now if done else None,
+        ))
+        if (user_id, course_id) in existing:
+            status = "updated" if progress is not None else "already_enrolled"
+        else:
+            status = "enrolled"
+            enrolled[course_id] += 1
+        if done and existing.get((user_id, course_id)) is None:
+            completed.append((user_id, course_id))
+        report[line_no] = {"line": line_no, "status": status, "email": email, "course_slug": slug}
+
+    if rows:
+        db.session.execute(_upsert(rows))
+        for course_id, count in enrolled.items():
+            counters.record_enrollments(course_id, count)
+        if completed:
+            _issue_certificates(completed, now)
+    db.session.commit()
+    return [report[line_no] for line_no in sorted(report)]
+
+
+def _issue_certificates(pairs, now):
+    have = set(db.session.execute(
+        db.select(Certificate.user_id, Certificate.course_id).where(
+            Certificate.user_id.in_({u for u, _ in pairs}),
+            Certificate.course_id.in_({c for _, c in pairs}),
+        )
+    ).all())
+    missing = [p for p in pairs if p not in have]
+    for course_id, count in Counter(c for _, c in pairs).items():
+        counters.record_completions(course_id, count)
+    if missing:
+        db.session.execute(db.insert(Certificate), [
+            dict(user_id=u, course_id=c, issued_at=now,
+                 certificate_code=f"NL-{uuid.uuid4().hex[:12].upper()}")
+            for u, c in missing
+        ])
+
+
+def import_enrollments(rows, chunk_size=1000):
+    """Yield one result dict per input row, then a {"summary": ...} record.
+
+    Works chunk by chunk (one transaction each), so memory stays bounded by
+    chunk_size however long the input is."""
+    totals = Counter()
+    for chunk in _chunks(rows, chunk_size):
+        try:
+            results = _process(chunk)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            error = type(e).__name__
+            results = [{"line": line_no, "status": "error", "error": error} for line_no, _ in chunk]
+        for result in results:
+            totals[result["status"]] += 1
+            yield result
+    yield {"summary": dict(totals)}
@@ -0,0 +1,204 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models.models import Course
+from services.metrics import metrics
+
+try:
+    import redis
+except ImportError:  # optional: only needed for CATALOG_CACHE_BACKEND=redis
+    redis = None
+
+VERSION_KEY    = "catalog:version"
+POPULARITY_KEY = "catalog:popularity"
+# Sorts ordered by the enrollment counters; only these are invalidated when the counters move.
+POPULARITY_SORTS = ("enrolled", "trending")
+
+
+class MemoryBackend:
+    """In-process LRU with a per-entry TTL. Each gunicorn worker has its own copy."""
+
+    def __init__(self, max_entries=512, ttl=60):
+        self.max_entries = max_entries
+        self.ttl         = ttl
+        self._entries    = OrderedDict()
+        self._counters   = {}
+        self._lock       = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Shared backend. `client` is anything exposing redis-py's get/set/delete/incr."""
+
+    def __init__(self, client, prefix="nl:", ttl=60):
+        self.client = client
+        self.prefix = prefix
+        self.ttl    = ttl
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, json.dumps(value), ex=ttl or self.ttl)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def counter(self, key):
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def incr(self, key):
+        return int(self.client.incr(self.prefix + key))
+
+
+class CatalogCache:
+    """Caches public catalog responses under a version that every Course write bumps."""
+
+    def __init__(self):
+        self.backend = None
+        self.hits    = 0
+        self.misses  = 0
+        self._local_version    = 0  # still tracked with caching disabled, for other version readers
+        self._local_popularity = 0
+
+    def init_app(self, app, backend=None):
+        cfg = app.config
+        if backend is None:
+            kind = cfg.get("CATALOG_CACHE_BACKEND", "memory")
+            ttl  = cfg.get("CATALOG_CACHE_TTL", 60)
+            if kind == "redis":
+                if redis is None:
+                    raise RuntimeError("CATALOG_CACHE_BACKEND=redis requires the redis package.")
+                backend = RedisBackend(redis.Redis.from_url(cfg["REDIS_URL"]), ttl=ttl)
+            elif kind == "memory":
+                backend = MemoryBackend(cfg.get("CATALOG_CACHE_SIZE", 512), ttl)
+        self.backend = backend
+        app.extensions["catalog_cache"] = self
+        metrics.gauge("catalog_cache_hits_total", lambda: self.hits, "Catalog cache hits", kind="counter")
+        metrics.gauge("catalog_cache_misses_total", lambda: self.misses, "Catalog cache misses", kind="counter")
+
+    def version(self):
+        return self.backend.counter(VERSION_KEY) if self.backend is not None else self._local_version
+
+    def bump(self):
+        if self.backend is not None:
+            self.backend.incr(VERSION_KEY)
+        else:
+            self._local_version += 1
+
+    def popularity(self):
+        return self.backend.counter(POPULARITY_KEY) if self.backend is not None else self._local_popularity
+
+    def bump_popularity(self):
+        if self.backend is not None:
+            self.backend.incr(POPULARITY_KEY)
+        else:
+            self._local_popularity += 1
+
+    def _versions(self, sort):
+        if sort in POPULARITY_SORTS:
+            return self.version(), self.popularity()
+        return self.version()
+
+    def validator(self, sort=None):
+        """HTTP validator for catalog responses.
+
+        A per-worker version is not seen by other workers, so it is paired with
+        a TTL-sized time bucket: validators then go stale no later than cached bodies."""
+        if isinstance(self.backend, RedisBackend):
+            return self._versions(sort)
+        ttl = getattr(self.backend, "ttl", 60)
+        return self._versions(sort), int(time.time() // ttl)
+
+    def _key(self, params):
+        return f"catalog:v{self._versions(params.get('sort'))}:{json.dumps(params, sort_keys=True)}"
+
+    def get(self, params):
+        if self.backend is None:
+            return None
+        value = self.backend.get(self._key(params))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, params, value):
+        if self.backend is not None:
+            self.backend.set(self._key(params), value)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "backend":   type(self.backend).__name__ if self.backend is not None else None,
+            "version":   self.version(),
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+catalog_cache = CatalogCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _track_course_writes(session, flush_context):
+    if any(isinstance(o, Course) for o in chain(session.new, session.dirty, session.deleted)):
+        session.info["catalog_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_catalog_version(session):
+    # Bump only once the rows are visible to other connections.
+    if session.info.pop("catalog_dirty", False):
+        catalog_cache.bump()
+    if session.info.pop("popularity_dirty", False):
+        catalog_cache.bump_popularity()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_flag(session):
+    session.info.pop("catalog_dirty", None)
+    session.info.pop("popularity_dirty", None)
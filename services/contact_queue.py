@@ -0,0 +1,142 @@
+import glob
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from models.models import db, ContactMessage
+from services.metrics import metrics
+from services.workers import BackgroundFlusher
+
+
+def _owner_pid(path):
+    # contact-<pid>.ndjson / .inflight, or <that>.claimed-<adopter pid>
+    name = os.path.basename(path)
+    if ".claimed-" in name:
+        return int(name.rsplit("-", 1)[1])
+    return int(name[len("contact-"):].split(".")[0])
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ContactQueue(BackgroundFlusher):
+    """Write-behind queue for contact form submissions.
+
+    Every enqueued row is appended to a per-process spool file before the
+    request returns, then inserted in multi-row batches by the flusher thread.
+    Spool files left behind by dead workers are adopted on start-up, so
+    delivery is at-least-once."""
+
+    name = "contact-queue"
+
+    def __init__(self):
+        super().__init__()
+        self.enabled    = False
+        self.batch_size = 100
+        self.spool_dir  = None
+        self._pending   = []
+        self._lock      = threading.Lock()
+
+    def init_app(self, app):
+        cfg = app.config
+        self.enabled    = cfg.get("CONTACT_QUEUE_ENABLED", True)
+        self.batch_size = cfg.get("CONTACT_BATCH_SIZE", 100)
+        self.spool_dir  = cfg.get("CONTACT_SPOOL_DIR") or os.path.join(app.instance_path, "spool")
+        super().init_app(app, cfg.get("CONTACT_FLUSH_INTERVAL", 2.0))
+        app.extensions["contact_queue"] = self
+        metrics.gauge("contact_queue_depth", self.depth, "Contact messages waiting to be inserted")
+        metrics.histogram("contact_flush_seconds", "Time to insert one batch of contact messages")
+        metrics.counter("contact_messages_flushed_total", "Contact messages written to the database")
+
+    def _spool_path(self, suffix="ndjson"):
+        return os.path.join(self.spool_dir, f"contact-{os.getpid()}.{suffix}")
+
+    def depth(self):
+        return len(self._pending)
+
+    def on_start(self):
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._pending = []
+        recovered = []
+        for path in glob.glob(os.path.join(self.spool_dir, "contact-*.*")):
+            if path.endswith(".tmp"):
+                continue
+            try:
+                pid = _owner_pid(path)
+            except ValueError:
+                continue
+            if pid != os.getpid() and _pid_alive(pid):
+                continue
+            claimed = f"{path}.claimed-{os.getpid()}"
+            try:
+                os.rename(path, claimed)  # atomic: only one worker adopts a file
+            except OSError:
+                continue
+            with open(claimed) as f:
+                recovered.extend(json.loads(line) for line in f if line.strip())
+            os.remove(claimed)
+        if recovered:
+            with self._lock:
+                self._pending.extend(recovered)
+                self._rewrite_spool()
+            self.app.logger.info("contact-queue: recovered %d spooled messages", len(recovered))
+            self.wake()
+
+    def enqueue(self, row):
+        row = dict(row, created_at=datetime.now(timezone.utc).isoformat())
+        self.ensure_started()
+        with self._lock:
+            with open(self._spool_path(), "a") as f:
+                f.write(json.dumps(row) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending.append(row)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.wake()
+
+    def _rewrite_spool(self):
+        tmp = self._spool_path("tmp")
+        with open(tmp, "w") as f:
+            f.writelines(json.dumps(row) + "\n" for row in self._pending)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._spool_path())
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            # New submissions go to a fresh spool while this batch is in flight.
+            inflight = self._spool_path("inflight")
+            os.replace(self._spool_path(), inflight)
+
+        start = time.perf_counter()
+        try:
+            rows = [dict(r, created_at=datetime.fromisoformat(r["created_at"])) for r in batch]
+            for i in range(0, len(rows), self.batch_size):
+                db.session.execute(db.insert(ContactMessage), rows[i:i + self.batch_size])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            with self._lock:
+                self._pending = batch + self._pending
+                self._rewrite_spool()
+            os.remove(inflight)
+            raise
+        os.remove(inflight)
+        metrics.observe("contact_flush_seconds", time.perf_counter() - start)
+        metrics.inc("contact_messages_flushed_total", len(batch))
+
+
+contact_queue = ContactQueue()
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+
+from models.models import db, Course, Enrollment
+
+# Atomic `SET x = x + n` updates: no read-modify-write, so concurrent enrollments
+# never lose increments. They only invalidate the sorts ordered by these counters
+# (catalog_cache.POPULARITY_SORTS) on commit; other catalog pages show the new
+# counts when their cache entry expires.
+
+
+def _increment(course_id, amount=1, **columns):
+    table = Course.__table__
+    db.session.execute(
+        table.update()
+        .where(table.c.id == course_id)
+        .values({name: table.c[name] + amount for name in columns})
+    )
+    db.session.info["popularity_dirty"] = True
+
+
+def record_enrollments(course_id, count=1):
+    _increment(course_id, count, enrollment_count=True, trending_score=True)
+
+
+def record_completions(course_id, count=1):
+    _increment(course_id, count, completion_count=True)
+
+
+def reconcile(conn=None):
+    """Recompute every counter from enrollments; trending_score counts enrollments
+    inside the TRENDING_WINDOW_DAYS sliding window, so this is also what decays it."""
+    days  = current_app.config.get("TRENDING_WINDOW_DAYS", 7)
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    e     = Enrollment.__table__
+
+    def per_course(*where):
+        return (
+            db.select(db.func.count()).select_from(e)
+            .where(e.c.course_id == Course.__table__.c.id, *where)
+            .scalar_subquery()
+        )
+
+    stmt = Course.__table__.update().values(
+        enrollment_count=per_course(),
+        completion_count=per_course(e.c.completed_at.isnot(None)),
+        trending_score=per_course(e.c.enrolled_at >= since),
+    )
+    if conn is not None:
+        return conn.execute(stmt).rowcount
+    rows = db.session.execute(stmt).rowcount
+    db.session.commit()
+    return rows
@@ -0,0 +1,96 @@
+import os
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from config.config import engine_options
+from models.models import db
+from services.metrics import metrics
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.inc("db_pool_timeouts_total")
+            raise
+        finally:
+            metrics.observe("db_pool_checkout_wait_seconds", time.perf_counter() - start)
+
+
+@event.listens_for(Pool, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    metrics.inc("db_pool_connections_opened_total")
+    connection_record.info["pid"] = os.getpid()
+
+
+@event.listens_for(Pool, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    # A connection inherited across fork (gunicorn --preload) shares its socket with
+    # the parent: detach it without closing and let the pool open a fresh one.
+    pid = os.getpid()
+    if connection_record.info.get("pid", pid) != pid:
+        connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+        raise exc.DisconnectionError(
+            f"connection from pid {connection_record.info['pid']} checked out in pid {pid}"
+        )
+
+
+@event.listens_for(Pool, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    metrics.inc("db_pool_connections_invalidated_total")
+
+
+@event.listens_for(Engine, "handle_error")
+def _on_error(context):
+    kind = "disconnect" if context.is_disconnect else type(context.original_exception).__name__
+    metrics.inc("db_connection_errors_total", kind=kind)
+
+
+def _without_timeouts(dialect, connection_record, cargs, cparams):
+    cparams.pop("read_timeout", None)
+    cparams.pop("write_timeout", None)
+    if "statement_timeout" in cparams.get("options", ""):
+        cparams.pop("options")
+
+
+def lift_statement_timeouts(engine):
+    """Drop the DB_READ_TIMEOUT guard for connections `engine` opens from now on.
+
+    The timeout bounds web requests; CLI maintenance (migrations, reconciles,
+    bulk imports, exports) legitimately runs for much longer."""
+    if not event.contains(engine, "do_connect", _without_timeouts):
+        event.listen(engine, "do_connect", _without_timeouts)
+        engine.dispose()
+
+
+def _pool_stat(name):
+    def read():
+        pool = db.engine.pool
+        return getattr(pool, name)() if hasattr(pool, name) else 0
+    return read
+
+
+def init_app(app):
+    """Call before db.init_app(app): the pool class is read when the engine is built."""
+    options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS")
+                   or engine_options(app.config["SQLALCHEMY_DATABASE_URI"]))
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+    if "pool_size" in options:
+        options.setdefault("poolclass", InstrumentedQueuePool)
+
+    metrics.counter("db_pool_timeouts_total", "Checkouts that gave up after pool_timeout")
+    metrics.counter("db_pool_connections_opened_total", "New DBAPI connections opened")
+    metrics.counter("db_pool_connections_invalidated_total", "Connections discarded as broken or stale")
+    metrics.counter("db_connection_errors_total", "DBAPI errors by kind")
+    metrics.histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection")
+    metrics.gauge("db_pool_size", _pool_stat("size"), "Configured pool size")
+    metrics.gauge("db_pool_checked_out", _pool_stat("checkedout"), "Connections currently in use")
+    metrics.gauge("db_pool_checked_in", _pool_stat("checkedin"), "Idle connections in the pool")
+    metrics.gauge("db_pool_overflow", _pool_stat("overflow"), "Connections beyond pool_size")
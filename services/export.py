@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from models.models import db, User, Course, Enrollment, Certificate, ContactMessage
+
+
+def _enrollments():
+    stmt = (
+        db.select(
+            Enrollment.id, Enrollment.user_id, User.email, Enrollment.course_id,
+            Course.slug.label("course_slug"), Course.title.label("course_title"),
+            Enrollment.progress_percent, Enrollment.lessons_completed,
+            Enrollment.time_spent_minutes, Enrollment.enrolled_at,
+            Enrollment.last_accessed_at, Enrollment.completed_at,
+            Certificate.certificate_code, Certificate.issued_at.label("certificate_issued_at"),
+        )
+        .join(Course, Course.id == Enrollment.course_id)
+        .join(User, User.id == Enrollment.user_id)
+        .outerjoin(Certificate, db.and_(Certificate.user_id == Enrollment.user_id,
+                                        Certificate.course_id == Enrollment.course_id))
+    )
+    return stmt, Enrollment.enrolled_at, Enrollment.id
+
+def _certificates():
+    stmt = (
+        db.select(
+            Certificate.id, Certificate.certificate_code, Certificate.user_id, User.email,
+            Certificate.course_id, Course.slug.label("course_slug"),
+            Course.title.label("course_title"), Certificate.issued_at,
+        )
+        .join(Course, Course.id == Certificate.course_id)
+        .join(User, User.id == Certificate.user_id)
+    )
+    return stmt, Certificate.issued_at, Certificate.id
+
+def _contact_messages():
+    stmt = db.select(
+        ContactMessage.id, ContactMessage.user_id, ContactMessage.first_name,
+        ContactMessage.last_name, ContactMessage.email, ContactMessage.company,
+        ContactMessage.topic, ContactMessage.message, ContactMessage.is_read,
+        ContactMessage.created_at, ContactMessage.inserted_at,
+    )
+    # Not created_at: queued messages are inserted a flush (or a spool recovery) later,
+    # and would land behind a previous run's `until`.
+    return stmt, ContactMessage.inserted_at, ContactMessage.id
+
+# name -> () -> (select, watermark column, tiebreak key); each watermark is indexed.
+EXPORTS = {
+    "enrollments":      _enrollments,
+    "certificates":     _certificates,
+    "contact_messages": _contact_messages,
+}
+
+
+def parse_watermark(value):
+    """ISO-8601 string -> naive UTC datetime (how the DateTime columns are stored)."""
+    if not value:
+        return None
+    ts = datetime.fromisoformat(value)
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+def default_until(lag_seconds):
+    # Stop a little behind the clock so rows stamped just before `until` by
+    # still-open transactions land in the next run instead of being skipped.
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=lag_seconds)
+
+
+def open_export(name, since, until, batch_size):
+    """Run export `name` over the half-open window [since, until).
+
+    The statement executes now, so it binds to the request's replica and fails
+    before any output is sent; rows are then pulled batch_size at a time from a
+    server-side cursor. Returns (columns, result)."""
+    stmt, watermark, key = EXPORTS[name]()
+    if since is not None:
+        stmt = stmt.where(watermark >= since)
+    stmt = stmt.where(watermark < until).order_by(watermark, key)
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+    return list(result.keys()), result
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+def ndjson_chunks(columns, result):
+    try:
+        for batch in result.partitions():
+            yield "".join(json.dumps(dict(zip(columns, map(_value, row)))) + "\n" for row in batch)
+    finally:
+        result.close()
+
+def csv_chunks(columns, result):
+    buf    = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    yield buf.getvalue()
+    try:
+        for batch in result.partitions():
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows([_value(v) for v in row] for row in batch)
+            yield buf.getvalue()
+    finally:
+        result.close()
+
+# format -> (mimetype, encoder)
+FORMATS = {
+    "ndjson": ("application/x-ndjson", ndjson_chunks),
+    "csv":    ("text/csv",             csv_chunks),
+}
@@ -0,0 +1,97 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+import bcrypt
+
+
+class HashingPoolSaturated(Exception):
+    """Raised instead of queueing when every hashing slot is taken."""
+
+
+def _hash(plain, rounds):
+    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt(rounds)).decode()
+
+
+def _check(plain, hashed):
+    return bcrypt.checkpw(plain.encode(), hashed.encode())
+
+
+def hash_cost(hashed):
+    # "$2b$12$<salt+digest>" -> 12
+    try:
+        return int(hashed.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Runs bcrypt in a per-worker process pool so request threads only wait on a future.
+
+    PASSWORD_HASH_WORKERS=0 hashes inline (the old behaviour)."""
+
+    def __init__(self):
+        self.rounds   = 12
+        self.workers  = 0
+        self.capacity = 0
+        self.timeout  = None
+        self.threaded = False  # gevent mode: real OS threads (bcrypt releases the GIL)
+        self._lock     = threading.Lock()
+        self._pid      = None
+        self._executor = None
+        self._slots    = None
+
+    def init_app(self, app):
+        cfg = app.config
+        self.rounds   = cfg.get("BCRYPT_ROUNDS", 12)
+        self.workers  = cfg.get("PASSWORD_HASH_WORKERS", 1)
+        self.capacity = cfg.get("PASSWORD_HASH_QUEUE", 0) or self.workers * 2
+        self.timeout  = cfg.get("PASSWORD_HASH_TIMEOUT", 10)
+        app.extensions["password_hasher"] = self
+
+    def _pool(self):
+        # Pools do not survive fork, so each gunicorn worker builds its own lazily.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    if self.threaded:
+                        from gevent.threadpool import ThreadPoolExecutor
+                        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+                    else:
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    self._slots    = threading.BoundedSemaphore(self.capacity)
+                    self._pid      = os.getpid()
+        return self._executor, self._slots
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+        executor, slots = self._pool()
+        if not slots.acquire(blocking=False):
+            raise HashingPoolSaturated()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        # The slot is held until the task itself finishes, not just until this
+        # request stops waiting, so the queue stays bounded under overload.
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()  # frees the slot now if the task never started
+            raise HashingPoolSaturated()
+
+    def hash(self, plain):
+        return self._run(_hash, plain, self.rounds)
+
+    def check(self, plain, hashed):
+        return self._run(_check, plain, hashed)
+
+    def needs_rehash(self, hashed):
+        cost = hash_cost(hashed)
+        return cost is not None and cost < self.rounds
+
+
+password_hasher = PasswordHasher()
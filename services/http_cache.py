@@ -0,0 +1,90 @@
+import gzip
+import hashlib
+from functools import wraps
+
+from flask import Response, current_app, make_response, request
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only without it
+    brotli = None
+
+ENCODING_SUFFIX = {"gzip": "-gz", "br": "-br"}
+
+
+def etag_for(basis):
+    """Strong ETag from a small validator (version counters, aggregates), never the body."""
+    return hashlib.sha1(repr(basis).encode()).hexdigest()[:24]
+
+
+def conditional(validator, scope="private"):
+    """Answer If-None-Match with 304 before the view (and its queries) runs.
+
+    `validator()` must be cheap and change whenever the response would. Public
+    responses may be cached for HTTP_PUBLIC_MAX_AGE seconds; private ones must
+    revalidate every time."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if scope == "public":
+                cache_control = f"public, max-age={current_app.config.get('HTTP_PUBLIC_MAX_AGE', 60)}"
+            else:
+                cache_control = "private, no-cache"
+            tag = etag_for(validator())
+            # Compressed variants carry a suffixed tag (see compress()), so match those too
+            # and echo the matched one: compress() never sees a 304.
+            matched = next((tag + suffix for suffix in ("", *ENCODING_SUFFIX.values())
+                            if request.if_none_match.contains(tag + suffix)), None)
+            if matched is not None:
+                response = Response(status=304)
+                response.set_etag(matched)
+                response.vary.add("Accept-Encoding")
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(tag)
+            response.headers["Cache-Control"] = cache_control
+            if scope != "public":
+                response.vary.add("Authorization")
+            return response
+        return wrapper
+    return decorator
+
+
+def _choose_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress(response):
+    cfg = current_app.config
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in ("application/json", "text/plain", "text/csv")):
+        return response
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    encoding = _choose_encoding() if len(body) >= cfg.get("COMPRESS_MIN_SIZE", 1024) else None
+    if encoding is None:
+        return response
+
+    if encoding == "br":
+        response.set_data(brotli.compress(body, quality=cfg.get("COMPRESS_BROTLI_QUALITY", 5)))
+    else:
+        response.set_data(gzip.compress(body, compresslevel=cfg.get("COMPRESS_LEVEL", 6)))
+    response.headers["Content-Encoding"] = encoding
+    tag, weak = response.get_etag()
+    if tag:
+        response.set_etag(tag + ENCODING_SUFFIX[encoding], weak=weak)
+    return response
+
+
+def init_app(app):
+    if app.config.get("COMPRESS_RESPONSES", True):
+        app.after_request(compress)
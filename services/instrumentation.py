@@ -0,0 +1,142 @@
+import cProfile
+import io
+import os
+import pstats
+import random
+import time
+import traceback
+from datetime import datetime, timezone
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from services.metrics import metrics
+from services.operator import is_operator
+
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Instrumentation:
+    """Opt-in per-request timing, SQL accounting, slow-query log and cProfile capture.
+
+    When INSTRUMENTATION_ENABLED is off, init_app registers nothing, so the
+    request and cursor paths carry no extra hooks at all."""
+
+    def __init__(self):
+        self.app           = None
+        self.slow_query_ms = 200
+        self.sample_rate   = 0.0
+        self.profile_dir   = None
+        self.profile_keep  = 200
+
+    def init_app(self, app):
+        if not app.config.get("INSTRUMENTATION_ENABLED"):
+            return
+        self.app           = app
+        self.slow_query_ms = app.config.get("SLOW_QUERY_MS", 200)
+        self.sample_rate   = app.config.get("PROFILE_SAMPLE_RATE", 0.0)
+        self.profile_dir   = app.config.get("PROFILE_DIR") or os.path.join(app.instance_path, "profiles")
+        self.profile_keep  = app.config.get("PROFILE_KEEP", 200)
+        app.extensions["instrumentation"] = self
+
+        metrics.histogram("http_request_duration_seconds", "Wall time per request")
+        metrics.histogram("http_request_db_seconds", "Time spent in SQL per request")
+        metrics.histogram("http_request_queries", "SQL statements per request", buckets=QUERY_BUCKETS)
+        metrics.counter("db_slow_queries_total", "Statements slower than SLOW_QUERY_MS")
+
+        for name, fn in (("before_cursor_execute", self._before_cursor),
+                         ("after_cursor_execute", self._after_cursor),
+                         ("handle_error", self._on_error)):
+            if not event.contains(Engine, name, fn):
+                event.listen(Engine, name, fn)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    # ── SQL ──────────────────────────────────────────
+    def _before_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after_cursor(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        if has_request_context() and "req_start" in g:
+            g.db_time += elapsed
+            g.queries += 1
+        if elapsed * 1000 >= self.slow_query_ms:
+            metrics.inc("db_slow_queries_total")
+            self.app.logger.warning(
+                "slow query %.1f ms at %s: %s", elapsed * 1000, self._call_site(), " ".join(statement.split())[:500]
+            )
+
+    def _on_error(self, context):
+        # A failed statement never reaches after_cursor_execute; drop its start time.
+        stack = context.connection.info.get("query_start") if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+    def _call_site(self):
+        root = self.app.root_path
+        for frame in reversed(traceback.extract_stack()):
+            if frame.filename.startswith(root) and not frame.filename.endswith("instrumentation.py") \
+                    and "site-packages" not in frame.filename:
+                return f"{os.path.relpath(frame.filename, root)}:{frame.lineno} in {frame.name}"
+        return "unknown"
+
+    # ── Requests ─────────────────────────────────────
+    def _start_request(self):
+        g.req_start = time.perf_counter()
+        g.db_time   = 0.0
+        g.queries   = 0
+        wants_profile = request.headers.get("X-Profile") == "1" and is_operator()
+        if wants_profile or (self.sample_rate and random.random() < self.sample_rate):
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+
+    def _finish_request(self, response):
+        if "req_start" not in g:
+            return response
+        labels = dict(endpoint=request.endpoint or "unmatched", method=request.method)
+        metrics.observe("http_request_duration_seconds", time.perf_counter() - g.req_start, **labels)
+        metrics.observe("http_request_db_seconds", g.db_time, **labels)
+        metrics.observe("http_request_queries", g.queries, **labels)
+        response.headers["Server-Timing"] = f"db;dur={g.db_time * 1000:.1f}, app;dur={(time.perf_counter() - g.req_start) * 1000:.1f}"
+
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+            response.headers["X-Profile-Id"] = self._save_profile(profiler, labels["endpoint"])
+        return response
+
+    def _save_profile(self, profiler, endpoint):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        name = f"{endpoint.replace('.', '-')}-{stamp}"
+        profiler.dump_stats(os.path.join(self.profile_dir, name + ".prof"))
+        self._prune_profiles()
+        return name
+
+    def _prune_profiles(self):
+        # Keep only the newest PROFILE_KEEP captures so sampling cannot fill the disk.
+        paths = [entry.path for entry in os.scandir(self.profile_dir) if entry.name.endswith(".prof")]
+        if len(paths) <= self.profile_keep:
+            return
+        paths.sort(key=lambda path: (os.path.getmtime(path), path))
+        for path in paths[:len(paths) - self.profile_keep]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # another worker pruned it first
+                pass
+
+    def profile_report(self, name, limit=40):
+        """Top functions by cumulative time for a saved profile, or None."""
+        if self.app is None or os.path.basename(name) != name:
+            return None
+        path = os.path.join(self.profile_dir, name + ".prof")
+        if not os.path.exists(path):
+            return None
+        out = io.StringIO()
+        pstats.Stats(path, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,94 @@
+import threading
+from collections import defaultdict
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _fmt_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    body = ",".join('{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in pairs)
+    return "{" + body + "}"
+
+
+class Metrics:
+    """Minimal per-process registry rendered in the Prometheus text format.
+
+    Each gunicorn worker keeps its own numbers; scrape every worker or sum upstream."""
+
+    def __init__(self):
+        self._lock       = threading.Lock()
+        self._meta       = {}                    # name -> (type, help)
+        self._counters   = defaultdict(float)    # (name, labels) -> value
+        self._histograms = {}                    # (name, labels) -> [bucket counts, sum, count]
+        self._buckets    = {}                    # name -> bucket bounds
+        self._callbacks  = {}                    # name -> fn() returning a number
+
+    def counter(self, name, help=""):
+        self._meta.setdefault(name, ("counter", help))
+
+    def histogram(self, name, help="", buckets=DEFAULT_BUCKETS):
+        self._meta.setdefault(name, ("histogram", help))
+        self._buckets.setdefault(name, tuple(buckets))
+
+    def gauge(self, name, fn, help="", kind="gauge"):
+        """Register a value read at scrape time (kind="counter" for monotonic callbacks)."""
+        self._meta[name] = (kind, help)
+        self._callbacks[name] = fn
+
+    def inc(self, name, amount=1, **labels):
+        self.counter(name)
+        with self._lock:
+            self._counters[(name, _labels(labels))] += amount
+
+    def observe(self, name, value, **labels):
+        self.histogram(name)
+        bounds = self._buckets[name]
+        key = (name, _labels(labels))
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [[0] * len(bounds), 0.0, 0]
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        with self._lock:
+            counters   = dict(self._counters)
+            histograms = {k: [list(v[0]), v[1], v[2]] for k, v in self._histograms.items()}
+        lines = []
+        for name, (kind, help) in sorted(self._meta.items()):
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            if name in self._callbacks:
+                try:
+                    lines.append(f"{name} {float(self._callbacks[name]())}")
+                except Exception:  # a broken collector must not break the scrape
+                    pass
+            elif kind == "counter":
+                for (n, labels), value in sorted(counters.items()):
+                    if n == name:
+                        lines.append(f"{name}{_fmt_labels(labels)} {value}")
+            elif kind == "histogram":
+                bounds = self._buckets[name]
+                for (n, labels), (counts, total, count) in sorted(histograms.items()):
+                    if n != name:
+                        continue
+                    for bound, c in zip(bounds, counts):
+                        lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', bound)])} {c}")
+                    lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {count}")
+                    lines.append(f"{name}_sum{_fmt_labels(labels)} {total}")
+                    lines.append(f"{name}_count{_fmt_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
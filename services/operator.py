@@ -0,0 +1,20 @@
+import hmac
+from functools import wraps
+
+from flask import current_app, jsonify, request
+
+
+def is_operator():
+    token = current_app.config.get("OPERATOR_TOKEN")
+    supplied = request.headers.get("X-Operator-Token", "")
+    return bool(token) and hmac.compare_digest(supplied.encode(), token.encode())
+
+
+def operator_required(fn):
+    """Guard for ops-only endpoints; disabled entirely until OPERATOR_TOKEN is set."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not is_operator():
+            return jsonify({"error": "Operator access required."}), 403
+        return fn(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,138 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from models.models import db, Course, Enrollment
+from services.metrics import metrics
+from services.workers import BackgroundFlusher
+
+TARGET_TTL = 600  # seconds an (enrollment id, total_lessons) lookup stays cached
+
+
+def _raise_to(column, param):
+    # SET col = max(col, :param), leaving col alone when :param is NULL (portable GREATEST)
+    new = db.func.coalesce(db.bindparam(param, type_=column.type), column)
+    return db.case((column < new, new), else_=column)
+
+
+class ProgressBuffer(BackgroundFlusher):
+    """Coalesces player heartbeats per (user_id, course_id) and writes them in batches.
+
+    Only the highest lessons_completed / time_spent_minutes seen since the last
+    flush is kept, and the UPDATE never lowers a stored value, so heartbeats
+    landing on different workers cannot regress each other. A heartbeat that
+    completes a course is handed back to the synchronous path instead."""
+
+    name = "progress-buffer"
+
+    def __init__(self):
+        super().__init__()
+        self.enabled  = False
+        self._buffer  = {}
+        self._targets = {}
+        self._lock    = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get("PROGRESS_BUFFER_ENABLED", False)
+        super().init_app(app, app.config.get("PROGRESS_FLUSH_INTERVAL", 5.0))
+        app.extensions["progress_buffer"] = self
+        metrics.gauge("progress_buffer_pending", lambda: len(self._buffer), "Enrollments with unflushed progress")
+        metrics.counter("progress_heartbeats_total", "Progress heartbeats by handling mode")
+        metrics.counter("progress_rows_flushed_total", "Enrollment rows updated by buffer flushes")
+        metrics.histogram("progress_flush_seconds", "Time to write one progress flush")
+
+    def lookup(self, user_id, course_id):
+        key = (user_id, course_id)
+        target = self._targets.get(key)
+        if target and time.monotonic() - target["seen"] < TARGET_TTL:
+            return target
+        row = db.session.execute(
+            db.select(Enrollment.id, Enrollment.completed_at, Course.total_lessons)
+            .join(Course, Course.id == Enrollment.course_id)
+            .where(Enrollment.user_id == user_id, Enrollment.course_id == course_id)
+        ).first()
+        if row is None:
+            return None
+        target = {
+            "key":           key,
+            "enrollment_id": row.id,
+            "total_lessons": row.total_lessons,
+            "completed":     row.completed_at is not None,
+            "seen":          time.monotonic(),
+        }
+        self._targets[key] = target
+        return target
+
+    def absorb(self, target, data):
+        """Buffer one heartbeat.
+
+        Returns (progress, None) when queued, or (None, merged_data) when the
+        heartbeat completes the course and must be applied synchronously."""
+        self.ensure_started()
+        key = target["key"]
+        with self._lock:
+            entry = self._buffer.get(key) or {"e_id": target["enrollment_id"], "lc": None, "mins": None, "pct": None}
+            lessons, minutes = entry["lc"], entry["mins"]
+            if "lessons_completed" in data:
+                lessons = max(lessons or 0, int(data["lessons_completed"]))
+            if "time_spent_minutes" in data:
+                minutes = max(minutes or 0, int(data["time_spent_minutes"]))
+            percent = entry["pct"]
+            if lessons is not None and target["total_lessons"]:
+                percent = round((lessons / target["total_lessons"]) * 100, 1)
+
+            if percent is not None and percent >= 100 and not target["completed"]:
+                self._buffer.pop(key, None)
+                target["completed"] = True
+                metrics.inc("progress_heartbeats_total", mode="completion")
+                merged = {"lessons_completed": lessons, "time_spent_minutes": minutes}
+                return None, {k: v for k, v in merged.items() if v is not None}
+
+            entry.update(lc=lessons, mins=minutes, pct=percent)
+            self._buffer[key] = entry
+        metrics.inc("progress_heartbeats_total", mode="buffered")
+        return {"lessons_completed": lessons, "time_spent_minutes": minutes, "progress_percent": percent}, None
+
+    def flush(self):
+        with self._lock:
+            batch, self._buffer = self._buffer, {}
+        cutoff = time.monotonic() - TARGET_TTL
+        for key in [k for k, t in self._targets.items() if t["seen"] < cutoff]:
+            self._targets.pop(key, None)
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        t = Enrollment.__table__
+        stmt = (
+            t.update()
+            .where(t.c.id == db.bindparam("e_id"))
+            .values(
+                lessons_completed=_raise_to(t.c.lessons_completed, "lc"),
+                time_spent_minutes=_raise_to(t.c.time_spent_minutes, "mins"),
+                progress_percent=_raise_to(t.c.progress_percent, "pct"),
+                last_accessed_at=db.bindparam("seen", type_=t.c.last_accessed_at.type),
+            )
+        )
+        seen = datetime.now(timezone.utc)
+        try:
+            db.session.execute(stmt, [dict(entry, seen=seen) for entry in batch.values()])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            with self._lock:
+                # Re-queue, keeping whichever values are higher.
+                for key, entry in batch.items():
+                    newer = self._buffer.get(key)
+                    if newer:
+                        for field in ("lc", "mins", "pct"):
+                            values = [v for v in (entry[field], newer[field]) if v is not None]
+                            newer[field] = max(values) if values else None
+                    else:
+                        self._buffer[key] = entry
+            raise
+        metrics.observe("progress_flush_seconds", time.perf_counter() - start)
+        metrics.inc("progress_rows_flushed_total", len(batch))
+
+
+progress_buffer = ProgressBuffer()
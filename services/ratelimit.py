@@ -0,0 +1,33 @@
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Sliding-window limiter kept in process memory (per gunicorn worker)."""
+
+    def __init__(self):
+        self._hits  = {}
+        self._lock  = threading.Lock()
+        self._swept = time.monotonic()
+
+    def allow(self, *keys, limit, window):
+        """Record one hit against every key, or against none if any key is over its limit."""
+        now = time.monotonic()
+        with self._lock:
+            windows = [self._hits.setdefault(key, deque()) for key in keys]
+            for hits in windows:
+                while hits and hits[0] <= now - window:
+                    hits.popleft()
+            if any(len(hits) >= limit for hits in windows):
+                return False
+            for hits in windows:
+                hits.append(now)
+            if now - self._swept > window:
+                self._sweep(now - window)
+            return True
+
+    def _sweep(self, cutoff):
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= cutoff]:
+            del self._hits[key]
+        self._swept = time.monotonic()
@@ -0,0 +1,42 @@
+import threading
+import time
+
+from models.models import db
+
+
+class Readiness:
+    """Cached database probe for /api/health/ready.
+
+    Borrowing a pooled connection (pre-ping included) answers the question;
+    the result is reused for READINESS_CACHE_SECONDS so frequent probes from
+    the load balancer do not turn into query load."""
+
+    def __init__(self):
+        self.app        = None
+        self.ttl        = 5
+        self._ready     = False
+        self._checked   = float("-inf")
+        self._lock      = threading.Lock()
+
+    def init_app(self, app):
+        self.app = app
+        self.ttl = app.config.get("READINESS_CACHE_SECONDS", 5)
+        app.extensions["readiness"] = self
+
+    def check(self):
+        if time.monotonic() - self._checked < self.ttl:
+            return self._ready
+        with self._lock:
+            if time.monotonic() - self._checked >= self.ttl:
+                try:
+                    with db.engine.connect() as conn:
+                        conn.execute(db.text("SELECT 1"))
+                    self._ready = True
+                except Exception as e:
+                    self.app.logger.warning("readiness check failed: %s", e)
+                    self._ready = False
+                self._checked = time.monotonic()
+        return self._ready
+
+
+readiness = Readiness()
@@ -0,0 +1,147 @@
+import itertools
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, request
+from flask_jwt_extended import get_jwt_identity
+from itsdangerous import BadSignature, TimestampSigner
+from sqlalchemy import create_engine, event, exc
+
+from config.config import engine_options
+from models.models import db
+from services.catalog_cache import MemoryBackend, RedisBackend, catalog_cache
+from services.db_pool import InstrumentedQueuePool
+from services.metrics import metrics
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+PIN_COOKIE    = "db_pin"
+
+
+def _current_user():
+    try:
+        return get_jwt_identity()
+    except RuntimeError:  # view is not behind jwt_required
+        return None
+
+
+class ReplicaRouter:
+    """Round-robin over healthy read replicas, with per-user read-your-writes pinning.
+
+    After a user's successful write, their reads stay on the primary for
+    REPLICA_PIN_SECONDS. The pin is kept server-side (shared when the catalog
+    backend is Redis, otherwise per worker) and also sent to the client as a
+    short-lived signed cookie, so the next read is pinned whichever worker
+    serves it."""
+
+    def __init__(self):
+        self.engines     = []
+        self.pin_seconds = 5
+        self.retry_after = 30
+        self.pins        = None
+        self._down_until = {}
+        self._cycle      = itertools.count()
+        self._lock       = threading.Lock()
+
+    def init_app(self, app):
+        cfg = app.config
+        self.pin_seconds = cfg.get("REPLICA_PIN_SECONDS", 5)
+        self.retry_after = cfg.get("REPLICA_RETRY_SECONDS", 30)
+        self.engines = []
+        for uri in cfg.get("SQLALCHEMY_REPLICA_URIS") or []:
+            options = engine_options(uri)
+            if "pool_size" in options:
+                options["poolclass"] = InstrumentedQueuePool
+            engine = create_engine(uri, **options)
+            event.listen(engine, "handle_error", self._on_error)
+            self.engines.append(engine)
+        if isinstance(catalog_cache.backend, RedisBackend):
+            self.pins = catalog_cache.backend
+        else:
+            self.pins = MemoryBackend(max_entries=100_000, ttl=self.pin_seconds)
+        app.extensions["replicas"] = self
+        app.after_request(self._pin_after_write)
+        metrics.gauge("db_replicas_healthy", lambda: len(self.healthy()), "Replicas currently eligible for reads")
+        metrics.counter("db_reads_routed_total", "Read-only requests by target database")
+
+    def healthy(self):
+        now = time.monotonic()
+        return [e for e in self.engines if self._down_until.get(e, 0) <= now]
+
+    def choose(self):
+        candidates = self.healthy()
+        if not candidates:
+            return None
+        return candidates[next(self._cycle) % len(candidates)]
+
+    def mark_down(self, engine):
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self.retry_after
+
+    def _on_error(self, context):
+        if context.is_disconnect or isinstance(context.sqlalchemy_exception, exc.OperationalError):
+            self.mark_down(context.engine)
+
+    def _signer(self):
+        return TimestampSigner(current_app.secret_key, salt="replica-pin")
+
+    def pin(self, user_id):
+        self.pins.set(f"pin:{user_id}", 1, ttl=self.pin_seconds)
+
+    def is_pinned(self, user_id):
+        if user_id is None:
+            return False
+        if self.pins.get(f"pin:{user_id}") is not None:
+            return True
+        token = request.cookies.get(PIN_COOKIE)
+        if not token:
+            return False
+        try:
+            return self._signer().unsign(token, max_age=self.pin_seconds).decode() == str(user_id)
+        except BadSignature:  # includes SignatureExpired
+            return False
+
+    def _pin_after_write(self, response):
+        if not self.engines:
+            return response
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            user_id = _current_user()
+            if user_id is not None:
+                self.pin(user_id)
+                response.set_cookie(PIN_COOKIE, self._signer().sign(str(user_id)).decode(),
+                                    max_age=self.pin_seconds, httponly=True,
+                                    secure=request.is_secure, samesite="Lax")
+        return response
+
+
+replicas = ReplicaRouter()
+
+
+def read_only(view):
+    """Route a GET view's queries to a replica unless the user just wrote.
+
+    Place it under @jwt_required() so the pin can be checked. If the replica
+    fails mid-request it is taken out of rotation and the view is retried
+    once on the primary."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        replica = None
+        if request.method == "GET" and not replicas.is_pinned(_current_user()):
+            replica = replicas.choose()
+        if replica is None:
+            metrics.inc("db_reads_routed_total", target="primary")
+            return view(*args, **kwargs)
+
+        g.db_replica = replica
+        metrics.inc("db_reads_routed_total", target="replica")
+        try:
+            return view(*args, **kwargs)
+        except exc.OperationalError:
+            replicas.mark_down(replica)
+            db.session.rollback()
+            g.db_replica = None
+            metrics.inc("db_reads_routed_total", target="primary")
+            return view(*args, **kwargs)
+        finally:
+            g.pop("db_replica", None)
+    return wrapper
@@ -0,0 +1,125 @@
+import bisect
+import re
+import threading
+import time
+from collections import defaultdict
+
+from flask import current_app
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from models.models import db, Course
+from services.catalog_cache import catalog_cache
+
+TOKEN_RE     = re.compile(r"\w+", re.UNICODE)
+TITLE_WEIGHT = 2.0
+INDEX_TTL    = 300  # seconds; bounds staleness when the catalog version is not shared
+
+# Must match the expression of the GIN index created in models.models.
+PG_VECTOR = "to_tsvector('simple', coalesce(courses.title, '') || ' ' || coalesce(courses.instructor, ''))"
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+class InvertedIndex:
+    """Token -> {course_id: weight} postings with prefix lookup, for dialects without FTS."""
+
+    def __init__(self):
+        self.postings = {}
+        self.tokens   = []
+        self.version  = None
+        self.built_at = 0.0
+        self._lock    = threading.Lock()
+
+    def build(self, rows):
+        postings = defaultdict(lambda: defaultdict(float))
+        for course_id, title, instructor in rows:
+            for token in tokenize(title):
+                postings[token][course_id] += TITLE_WEIGHT
+            for token in tokenize(instructor):
+                postings[token][course_id] += 1.0
+        self.postings = {t: dict(p) for t, p in postings.items()}
+        self.tokens   = sorted(self.postings)
+
+    def _prefix_matches(self, prefix):
+        scores = defaultdict(float)
+        i = bisect.bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            token = self.tokens[i]
+            # An exact token match outranks a prefix match.
+            boost = 1.0 if token == prefix else 0.5
+            for course_id, weight in self.postings[token].items():
+                scores[course_id] = max(scores[course_id], weight * boost)
+            i += 1
+        return scores
+
+    def search(self, term):
+        """Return [(course_id, score)] matching every query token, best first."""
+        result = None
+        for prefix in tokenize(term):
+            matches = self._prefix_matches(prefix)
+            if result is None:
+                result = dict(matches)
+            else:
+                result = {cid: s + matches[cid] for cid, s in result.items() if cid in matches}
+            if not result:
+                return []
+        return sorted((result or {}).items(), key=lambda item: (-item[1], -item[0]))
+
+    def refresh(self):
+        version = catalog_cache.version()
+        if self.version == version and time.monotonic() - self.built_at < INDEX_TTL:
+            return
+        with self._lock:
+            if self.version == version and time.monotonic() - self.built_at < INDEX_TTL:
+                return
+            rows = db.session.execute(
+                db.select(Course.id, Course.title, Course.instructor)
+                .where(Course.is_published.is_(True))
+            ).all()
+            self.build(rows)
+            self.version  = version
+            self.built_at = time.monotonic()
+
+
+search_index = InvertedIndex()
+
+
+def _mysql_search(query, tokens, min_token_size):
+    # InnoDB never indexes tokens shorter than innodb_ft_min_token_size ("ai", "ux", "ml"),
+    # so MATCH cannot find them; those tokens fall back to a LIKE on the same columns.
+    indexed = [t for t in tokens if len(t) >= min_token_size]
+    for token in tokens:
+        if len(token) < min_token_size:
+            pattern = "%" + token.replace("_", "\\_") + "%"
+            query = query.filter(db.or_(Course.title.ilike(pattern, escape="\\"),
+                                        Course.instructor.ilike(pattern, escape="\\")))
+    if not indexed:
+        return query, None
+    match = mysql_match(
+        Course.title, Course.instructor, against=" ".join(f"+{t}*" for t in indexed)
+    ).in_boolean_mode()
+    return query.filter(match), match
+
+
+def search_courses(query, term):
+    """Restrict a Course query to `term`; returns (query, relevance expression or None)."""
+    tokens = tokenize(term)
+    if not tokens:
+        return query, None
+
+    dialect = db.engine.dialect.name
+    if dialect == "mysql":
+        return _mysql_search(query, tokens, current_app.config.get("MYSQL_FT_MIN_TOKEN_SIZE", 3))
+    if dialect == "postgresql":
+        tsquery = db.func.to_tsquery("simple", " & ".join(f"{t}:*" for t in tokens))
+        vector  = db.literal_column(PG_VECTOR)
+        return query.filter(vector.op("@@")(tsquery)), db.func.ts_rank(vector, tsquery)
+
+    search_index.refresh()
+    ranked = search_index.search(term)
+    if not ranked:
+        return query.filter(db.false()), None
+    relevance = db.case({cid: score for cid, score in ranked}, value=Course.id, else_=0)
+    return query.filter(Course.id.in_([cid for cid, _ in ranked])), relevance
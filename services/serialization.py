@@ -0,0 +1,70 @@
+import json
+import threading
+from operator import attrgetter
+
+from models.models import Course
+
+try:
+    import orjson
+except ImportError:  # optional: JSON_FAST_ENCODER falls back to the stdlib encoder
+    orjson = None
+
+
+class Fragment(bytes):
+    """Already-encoded JSON, spliced verbatim into larger documents."""
+
+
+# Every column a course fragment can depend on, read in one C-level call.
+_course_row = attrgetter(*(c.key for c in Course.__table__.columns))
+
+
+class FragmentCache:
+    """Per-course pre-encoded JSON, reused across catalog pages and enrollment lists.
+
+    Fragments are keyed on the course row as loaded, so a changed row is
+    re-encoded however it changed: another worker, a CLI command or a Core
+    UPDATE such as the popularity counters."""
+
+    def __init__(self):
+        self.use_orjson = False
+        self._fragments = {}
+        self._lock      = threading.Lock()
+
+    def init_app(self, app):
+        self.use_orjson = bool(app.config.get("JSON_FAST_ENCODER")) and orjson is not None
+        app.extensions["fragment_cache"] = self
+
+    def dumps(self, obj):
+        if self.use_orjson:
+            return Fragment(orjson.dumps(obj))
+        return Fragment(json.dumps(obj, separators=(",", ":")).encode())
+
+    def course(self, course):
+        row    = _course_row(course)
+        cached = self._fragments.get(course.id)
+        if cached is not None and cached[0] == row:
+            return cached[1]
+        fragment = self.dumps(course.to_dict())
+        with self._lock:
+            self._fragments[course.id] = (row, fragment)
+        return fragment
+
+    def enrollment(self, enrollment):
+        fields = enrollment.to_dict(include_course=False)
+        course = self.course(enrollment.course) if enrollment.course else b"null"
+        body = self.dumps(fields)
+        return Fragment(b'{"course":' + course + (b"," + body[1:] if len(body) > 2 else b"}"))
+
+    def array(self, fragments):
+        return Fragment(b"[" + b",".join(fragments) + b"]")
+
+    def document(self, **parts):
+        """Encode a top-level object whose values may be pre-encoded Fragments."""
+        members = []
+        for key, value in parts.items():
+            encoded = value if isinstance(value, Fragment) else self.dumps(value)
+            members.append(self.dumps(key) + b":" + encoded)
+        return Fragment(b"{" + b",".join(members) + b"}")
+
+
+fragments = FragmentCache()
@@ -0,0 +1,40 @@
+import sys
+
+from services.hashing import password_hasher
+
+try:
+    import gevent.monkey
+except ImportError:  # only required for SERVER_MODE=gevent
+    gevent = None
+
+
+def init_app(app):
+    """Adapt process-wide services to the serving mode chosen by SERVER_MODE.
+
+    "sync"   - gunicorn sync workers, one request in flight per worker.
+    "gevent" - gunicorn gevent workers (see gunicorn.conf.py): the worker
+               monkey-patches the stdlib, so PyMySQL's pure-Python socket I/O
+               yields to other requests and one worker serves many concurrent
+               catalog/dashboard reads.
+    """
+    mode = app.config.get("SERVER_MODE", "sync")
+    app.extensions["server_mode"] = mode
+    if mode != "gevent":
+        return
+    if gevent is None:
+        raise RuntimeError("SERVER_MODE=gevent requires the gevent package.")
+    if not gevent.monkey.is_module_patched("socket"):
+        app.logger.warning("SERVER_MODE=gevent but the stdlib is not monkey-patched; "
+                           "run under gunicorn's gevent worker class.")
+
+    # bcrypt would block the hub inline, and a process pool's manager thread does
+    # not mix with patched threading; gevent's pool runs it on real OS threads.
+    password_hasher.threaded = True
+
+    # psycopg2 is a C driver and needs an explicit wait callback to cooperate.
+    if "psycopg2" in sys.modules or app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgres"):
+        try:
+            from psycogreen.gevent import patch_psycopg
+            patch_psycopg()
+        except ImportError:
+            app.logger.warning("psycogreen is not installed; Postgres queries will block the gevent hub.")
@@ -0,0 +1,60 @@
+import atexit
+import os
+import threading
+
+
+class BackgroundFlusher:
+    """Daemon thread that calls flush() every `interval` seconds, or sooner when woken.
+
+    The thread is started lazily from the first request so that each forked
+    gunicorn worker runs its own; pending work is flushed once more at exit."""
+
+    name = "flusher"
+
+    def __init__(self):
+        self.app      = None
+        self.interval = 1.0
+        self._pid     = None
+        self._wake    = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def init_app(self, app, interval):
+        self.app      = app
+        self.interval = interval
+        atexit.register(self._final_flush)
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self.on_start()
+            threading.Thread(target=self._run, name=self.name, daemon=True).start()
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._flush_logged()
+
+    def _flush_logged(self):
+        try:
+            with self.app.app_context():
+                self.flush()
+        except Exception:
+            self.app.logger.exception("%s: flush failed", self.name)
+
+    def _final_flush(self):
+        if self._pid == os.getpid():
+            self._flush_logged()
+
+    def on_start(self):
+        """Hook run once per process before the thread starts."""
+
+    def flush(self):
+        raise NotImplementedError
@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+# Config is read at import time; point it at SQLite before the app is imported.
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/import.db")
+os.environ.setdefault("CONTACT_QUEUE_ENABLED", "false")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-long-enough-for-hs256")
+
+import pytest  # noqa: E402
+from flask_jwt_extended import create_access_token  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app  # noqa: E402
+from models.migrations import run_migrations  # noqa: E402
+from models.models import db, User, Course  # noqa: E402
+from routes.contact import limiter  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/test.db", "TESTING": True})
+    limiter._hits.clear()  # module-level, like in a real worker
+    with app.app_context():
+        db.create_all()
+        run_migrations()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    def make(email="learner@example.com"):
+        user = User(first_name="Test", last_name="User", email=email, password_hash="x")
+        db.session.add(user)
+        db.session.commit()
+        return user, {"Authorization": f"Bearer {create_access_token(identity=str(user.id))}"}
+    return make
+
+
+@pytest.fixture
+def make_courses(app):
+    def make(n, **fields):
+        courses = [Course(title=f"Course {i}", slug=f"course-{i}", instructor="Teacher",
+                          category="tech", **fields) for i in range(n)]
+        db.session.add_all(courses)
+        db.session.commit()
+        return courses
+    return make
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager factory: `with count_queries() as n: ...; n["count"]`."""
+    class Counter:
+        def __enter__(self):
+            self.stats = {"count": 0}
+            event.listen(db.engine, "before_cursor_execute", self._count)
+            return self.stats
+
+        def __exit__(self, *exc):
+            event.remove(db.engine, "before_cursor_execute", self._count)
+
+        def _count(self, *args):
+            self.stats["count"] += 1
+    return Counter
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from models.models import db, Certificate, Course, Enrollment
+
+TOKEN = {"X-Operator-Token": "ops-secret"}
+
+
+@pytest.fixture(autouse=True)
+def operator(app):
+    app.config["OPERATOR_TOKEN"] = "ops-secret"
+
+
+def _import(client, rows, **params):
+    body = "".join(json.dumps(row) + "\n" for row in rows)
+    response = client.post("/api/courses/bulk/enroll", data=body, query_string=params, headers=TOKEN)
+    assert response.status_code == 200
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+    return results, summary["summary"]
+
+
+def test_bulk_enroll_requires_operator(client):
+    assert client.post("/api/courses/bulk/enroll", data="").status_code == 403
+
+
+def test_reports_every_status(client, make_user, make_courses):
+    user, _ = make_user()
+    course, other = make_courses(2)
+    db.session.add(Enrollment(user_id=user.id, course_id=other.id))
+    db.session.commit()
+
+    body = "\n".join([
+        json.dumps({"email": user.email, "course_slug": course.slug}),
+        json.dumps({"email": user.email, "course_slug": other.slug}),
+        json.dumps({"email": "nobody@example.com", "course_slug": course.slug}),
+        json.dumps({"email": user.email, "course_slug": "missing"}),
+        json.dumps({"email": user.email.upper(), "course_slug": course.slug}),
+        json.dumps({"email": user.email, "course_slug": course.slug, "progress": 150}),
+        "not json",
+    ]) + "\n"
+    response = client.post("/api/courses/bulk/enroll", data=body, headers=TOKEN)
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [r["status"] for r in results] == [
+        "enrolled", "already_enrolled", "unknown_user", "unknown_course",
+        "duplicate", "invalid", "invalid",
+    ]
+    assert [r["line"] for r in results] == list(range(1, 8))
+    assert summary["summary"] == {"enrolled": 1, "already_enrolled": 1, "unknown_user": 1,
+                                  "unknown_course": 1, "duplicate": 1, "invalid": 2}
+
+
+@pytest.mark.parametrize("row", [
+    {"email": 5, "course_slug": "course-0"},
+    {"email": ["a@example.com"], "course_slug": "course-0"},
+    {"email": "learner@example.com", "course_slug": {"slug": "course-0"}},
+    {"email": "learner@example.com", "course_slug": "course-0", "progress": True},
+    {"email": "learner@example.com", "course_slug": "course-0", "progress": [50]},
+    {"email": "learner@example.com", "course_slug": "course-0", "progress": "half"},
+])
+def test_non_string_fields_are_invalid(client, make_user, make_courses, row):
+    make_user()
+    make_courses(1)
+    results, summary = _import(client, [row])
+    assert results[0]["status"] == "invalid"
+    assert summary == {"invalid": 1}
+    assert Enrollment.query.count() == 0
+
+
+def test_upsert_only_raises_progress(client, make_user, make_courses):
+    user, _ = make_user()
+    course, = make_courses(1, total_lessons=10)
+    row = {"email": user.email, "course_slug": course.slug}
+
+    assert _import(client, [dict(row, progress=60)])[0][0]["status"] == "enrolled"
+    assert _import(client, [dict(row, progress=30)])[0][0]["status"] == "updated"
+    enrollment = Enrollment.query.one()
+    assert (enrollment.progress_percent, enrollment.lessons_completed) == (60, 6)
+
+    _import(client, [dict(row, progress="80")])
+    db.session.refresh(enrollment)
+    assert (enrollment.progress_percent, enrollment.lessons_completed) == (80, 8)
+    assert enrollment.completed_at is None
+    assert db.session.get(Course, course.id).enrollment_count == 1
+
+
+def test_duplicates_within_a_chunk_keep_the_first_row(client, make_user, make_courses):
+    user, _ = make_user()
+    course, = make_courses(1)
+    rows = [
+        {"email": user.email, "course_slug": course.slug, "progress": 20},
+        {"email": user.email, "course_slug": course.slug, "progress": 90},
+    ]
+    results, summary = _import(client, rows, format="ndjson")
+    assert [r["status"] for r in results] == ["enrolled", "duplicate"]
+    assert Enrollment.query.one().progress_percent == 20
+    assert db.session.get(Course, course.id).enrollment_count == 1
+
+
+def test_completion_issues_one_certificate_and_counts_once(client, make_user, make_courses):
+    user, _ = make_user()
+    course, = make_courses(1, total_lessons=4)
+    row = {"email": user.email, "course_slug": course.slug, "progress": 100}
+
+    _import(client, [row])
+    _import(client, [row])  # re-importing a completed row changes nothing
+
+    enrollment = Enrollment.query.one()
+    assert enrollment.completed_at is not None
+    assert enrollment.lessons_completed == 4
+    assert Certificate.query.filter_by(user_id=user.id, course_id=course.id).count() == 1
+    course = db.session.get(Course, course.id)
+    assert (course.enrollment_count, course.completion_count) == (1, 1)
+
+
+def test_csv_input(client, make_user, make_courses):
+    user, _ = make_user()
+    course, = make_courses(1)
+    body = f"email,course_slug,progress\n{user.email},{course.slug},\n"
+    response = client.post("/api/courses/bulk/enroll", data=body,
+                           content_type="text/csv", headers=TOKEN)
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+    assert results == [{"line": 2, "status": "enrolled", "email": user.email, "course_slug": course.slug}]
+    assert summary == {"summary": {"enrolled": 1}}
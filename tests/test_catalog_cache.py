@@ -0,0 +1,22 @@
+from models.models import db
+from services.catalog_cache import catalog_cache
+
+
+def test_catalog_pages_are_cached_until_a_course_changes(client, make_courses):
+    course = make_courses(1)[0]
+    hits, misses = catalog_cache.hits, catalog_cache.misses
+    for _ in range(2):
+        client.get("/api/courses/")
+    assert catalog_cache.stats()["backend"] == "MemoryBackend"
+    assert (catalog_cache.hits - hits, catalog_cache.misses - misses) == (1, 1)
+
+    course.title = "Renamed"
+    db.session.commit()
+    assert client.get("/api/courses/").get_json()["courses"][0]["title"] == "Renamed"
+
+
+def test_cache_stats_are_operator_only(app, client):
+    app.config["OPERATOR_TOKEN"] = "ops-secret"
+    assert client.get("/api/courses/cache/stats").status_code == 403
+    response = client.get("/api/courses/cache/stats", headers={"X-Operator-Token": "ops-secret"})
+    assert response.get_json()["backend"] == "MemoryBackend"
@@ -0,0 +1,27 @@
+def _post(client, email, ip):
+    return client.post(
+        "/api/contact/",
+        json={"first_name": "Ann", "email": email, "message": "hi"},
+        # The client may send any first hop; the proxy appends the real address.
+        headers={"X-Forwarded-For": f"10.9.9.9, {ip}"},
+    ).status_code
+
+
+def test_rate_limit_ignores_spoofed_forwarded_for(app, client):
+    limit = app.config["CONTACT_RATE_LIMIT"]
+    statuses = [client.post(
+        "/api/contact/",
+        json={"first_name": "Ann", "email": f"ann{i}@example.com", "message": "hi"},
+        headers={"X-Forwarded-For": f"10.0.0.{i}, 203.0.113.7"},
+    ).status_code for i in range(limit + 3)]
+    assert statuses[:limit] == [201] * limit
+    assert statuses[limit:] == [429] * 3
+
+
+def test_rejected_request_does_not_count_against_the_other_limit(app, client):
+    limit = app.config["CONTACT_RATE_LIMIT"]
+    assert [_post(client, "ann@example.com", "203.0.113.1") for _ in range(limit)] == [201] * limit
+    # The email is exhausted; these must not use up 203.0.113.2's allowance.
+    assert [_post(client, "ann@example.com", "203.0.113.2") for _ in range(3)] == [429] * 3
+    statuses = [_post(client, f"bob{i}@example.com", "203.0.113.2") for i in range(limit)]
+    assert statuses == [201] * limit
@@ -0,0 +1,98 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+
+from models.models import db, ContactMessage
+from services.contact_queue import contact_queue
+
+DEAD_PID = 2 ** 22 + 1  # above the default pid_max, so never a live process
+
+
+def _row(i):
+    return dict(first_name="Ann", last_name="Lee", email=f"ann{i}@example.com", company=None,
+                topic="General", message=f"hello {i}")
+
+
+def _spooled(path):
+    with open(path) as f:
+        return [json.loads(line)["email"] for line in f]
+
+
+@pytest.fixture
+def queue(app, tmp_path, monkeypatch):
+    app.config.update(CONTACT_QUEUE_ENABLED=True, CONTACT_BATCH_SIZE=2,
+                      CONTACT_SPOOL_DIR=str(tmp_path / "spool"))
+    contact_queue.init_app(app)
+    monkeypatch.setattr(contact_queue, "_pid", os.getpid())  # no flusher thread; tests flush by hand
+    monkeypatch.setattr(contact_queue, "wake", lambda: None)
+    contact_queue.on_start()
+    yield contact_queue
+    contact_queue.enabled  = False
+    contact_queue._pending = []
+
+
+def _messages():
+    return sorted(db.session.execute(db.select(ContactMessage.email)).scalars())
+
+
+def test_post_is_spooled_and_accepted(queue, client):
+    response = client.post("/api/contact/", json={"first_name": "Ann", "email": "ann@example.com", "message": "hi"})
+    assert response.status_code == 202
+    assert _spooled(queue._spool_path()) == ["ann@example.com"]
+    assert _messages() == []
+
+    queue.flush()
+    assert _messages() == ["ann@example.com"]
+    assert os.listdir(queue.spool_dir) == []
+
+
+def test_flush_inserts_in_batches(queue):
+    for i in range(5):
+        queue.enqueue(_row(i))
+    inserts = []
+    listener = lambda conn, cursor, statement, *args: inserts.append(statement)  # noqa: E731
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        queue.flush()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+    assert len(inserts) == 3  # batches of 2, 2 and 1
+    assert len(_messages()) == 5
+
+
+def test_failed_flush_requeues_and_rewrites_the_spool(queue, monkeypatch):
+    queue.enqueue(_row(0))
+    queue.enqueue(_row(1))
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database down")
+    with monkeypatch.context() as patched, pytest.raises(RuntimeError):
+        patched.setattr(db.session, "execute", fail)
+        queue.flush()
+
+    assert queue.depth() == 2
+    assert sorted(os.listdir(queue.spool_dir)) == [os.path.basename(queue._spool_path())]
+    assert _spooled(queue._spool_path()) == ["ann0@example.com", "ann1@example.com"]
+
+    queue.flush()
+    assert _messages() == ["ann0@example.com", "ann1@example.com"]
+
+
+def test_dead_worker_spools_are_adopted(queue):
+    os.makedirs(queue.spool_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).isoformat()
+    for pid, name in ((DEAD_PID, "dead"), (os.getppid(), "alive")):
+        with open(os.path.join(queue.spool_dir, f"contact-{pid}.ndjson"), "w") as f:
+            f.write(json.dumps(dict(_row(0), email=f"{name}@example.com", created_at=stamp)) + "\n")
+
+    queue.on_start()
+    assert [row["email"] for row in queue._pending] == ["dead@example.com"]
+    assert sorted(os.listdir(queue.spool_dir)) == sorted([
+        f"contact-{os.getppid()}.ndjson", os.path.basename(queue._spool_path()),
+    ])
+
+    queue.flush()
+    assert _messages() == ["dead@example.com"]
@@ -0,0 +1,73 @@
+import base64
+import json
+
+
+def _cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def test_malformed_cursor_is_rejected(client, make_courses):
+    make_courses(3, price=10)
+    for payload in ({"s": "price-lo", "v": "abc", "i": 1}, {"s": "newest", "v": "nope", "i": 1}):
+        response = client.get("/api/courses/", query_string={"sort": payload["s"], "cursor": _cursor(payload)})
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Invalid cursor."}
+
+
+def test_course_fragments_follow_the_row(client, make_user, make_courses):
+    course_id = make_courses(1)[0].id
+    client.get("/api/courses/", query_string={"sort": "enrolled"})  # encodes the fragment
+
+    for email in ("a@example.com", "b@example.com"):
+        _, headers = make_user(email)
+        assert client.post(f"/api/courses/{course_id}/enroll", headers=headers).status_code == 201
+
+    enrolled = client.get("/api/courses/my/enrolled", headers=headers).get_json()["enrollments"]
+    assert enrolled[0]["course"]["enrollment_count"] == 2
+
+
+def test_enrollment_counters_reach_cached_catalog(client, make_user, make_courses):
+    course_ids = [c.id for c in make_courses(2)]
+    client.get("/api/courses/", query_string={"sort": "enrolled"})  # cache the page
+
+    _, headers = make_user()
+    client.post(f"/api/courses/{course_ids[1]}/enroll", headers=headers)
+
+    courses = client.get("/api/courses/", query_string={"sort": "enrolled"}).get_json()["courses"]
+    assert [(c["id"], c["enrollment_count"]) for c in courses] == [(course_ids[1], 1), (course_ids[0], 0)]
+
+
+def test_my_courses_etag_changes_on_offsetting_progress(client, make_user, make_courses):
+    _, headers = make_user()
+    first, second = (c.id for c in make_courses(2))
+    for course_id, minutes in ((first, 10), (second, 20)):
+        client.post(f"/api/courses/{course_id}/enroll", headers=headers)
+        client.put(f"/api/courses/{course_id}/progress", json={"time_spent_minutes": minutes}, headers=headers)
+    etag = client.get("/api/courses/my/enrolled", headers=headers).headers["ETag"]
+
+    # Same totals across the two enrollments, different rows.
+    client.put(f"/api/courses/{first}/progress", json={"time_spent_minutes": 20}, headers=headers)
+    client.put(f"/api/courses/{second}/progress", json={"time_spent_minutes": 10}, headers=headers)
+    response = client.get("/api/courses/my/enrolled", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert [e["time_spent_minutes"] for e in response.get_json()["enrollments"]] == [20, 10]
+
+
+def test_other_users_enrollments_keep_caches_warm(client, make_user, make_courses):
+    from services.catalog_cache import catalog_cache
+
+    first, second = (c.id for c in make_courses(2))
+    _, alice = make_user("alice@example.com")
+    _, bob   = make_user("bob@example.com")
+    client.post(f"/api/courses/{first}/enroll", headers=alice)
+    etags = {path: client.get(path, headers=alice).headers["ETag"]
+             for path in ("/api/courses/my/enrolled", "/api/dashboard/stats")}
+    client.get("/api/courses/")  # cache the default (popular) page
+
+    client.post(f"/api/courses/{second}/enroll", headers=bob)
+
+    for path, etag in etags.items():
+        assert client.get(path, headers={**alice, "If-None-Match": etag}).status_code == 304
+    hits = catalog_cache.hits
+    client.get("/api/courses/")
+    assert catalog_cache.hits == hits + 1
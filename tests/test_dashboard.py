@@ -0,0 +1,14 @@
+from models.models import db, Enrollment
+
+
+def test_summary_matches_stats(client, make_user, make_courses):
+    user, headers = make_user()
+    for course, minutes in zip(make_courses(2), (45, 45)):
+        db.session.add(Enrollment(user_id=user.id, course_id=course.id, time_spent_minutes=minutes))
+    db.session.commit()
+
+    summary = client.get("/api/dashboard/summary", headers=headers).get_json()
+    stats   = client.get("/api/dashboard/stats", headers=headers).get_json()
+    assert summary["total_hours"] == stats["total_hours"] == 1.5
+    assert isinstance(summary["total_hours"], float)
+    assert summary["courses_enrolled"] == stats["courses_enrolled"] == 2
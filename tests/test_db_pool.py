@@ -0,0 +1,49 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from services.db_pool import lift_statement_timeouts
+
+
+def test_lift_statement_timeouts_drops_read_timeouts():
+    # sqlite3.connect() rejects these, so connecting proves they were dropped.
+    engine = create_engine("sqlite://", connect_args={"read_timeout": 30, "write_timeout": 30})
+    with pytest.raises(TypeError):
+        engine.connect()
+
+    lift_statement_timeouts(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_engine_options_follow_the_app_uri(tmp_path):
+    from app import create_app
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "mysql+pymysql://user:pw@db.invalid/lms"})
+    options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    assert options["pool_size"] and options["connect_args"]["read_timeout"]
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/x.db"})
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == {}
+
+
+def test_forked_child_does_not_reuse_parent_connections(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/fork.db")
+    with engine.connect() as conn:
+        parent = conn.connection.dbapi_connection
+
+    pid = os.fork()
+    if pid == 0:  # child: must get a fresh connection, not the parent's socket
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                fresh = conn.connection.dbapi_connection is not parent
+            os._exit(0 if fresh else 1)
+        except BaseException:
+            os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    with engine.connect() as conn:  # the parent's pooled connection is untouched
+        assert conn.connection.dbapi_connection is parent
@@ -0,0 +1,30 @@
+import time
+
+import pytest
+
+from services.hashing import PasswordHasher, HashingPoolSaturated
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher()
+    hasher.workers, hasher.capacity, hasher.timeout = 1, 1, 0.2
+    yield hasher
+    hasher._pool()[0].shutdown(wait=True)
+
+
+def test_timeout_is_saturation_and_keeps_the_slot(hasher):
+    with pytest.raises(HashingPoolSaturated):
+        hasher._run(time.sleep, 1)
+    # The sleep is still running in the pool, so its slot is still taken.
+    with pytest.raises(HashingPoolSaturated):
+        hasher._run(abs, -1)
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            assert hasher._run(abs, -1) == 1
+            return
+        except HashingPoolSaturated:
+            time.sleep(0.05)
+    pytest.fail("slot was never released after the task finished")
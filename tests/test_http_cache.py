@@ -0,0 +1,30 @@
+def test_gzip_revalidation_echoes_the_variant_tag(app, client, make_user, make_courses):
+    app.config["COMPRESS_MIN_SIZE"] = 0
+    _, headers = make_user()
+    client.post(f"/api/courses/{make_courses(1)[0].id}/enroll", headers=headers)
+    headers = {**headers, "Accept-Encoding": "gzip"}
+
+    first = client.get("/api/courses/my/enrolled", headers=headers)
+    assert first.headers["Content-Encoding"] == "gzip"
+    etag = first.headers["ETag"]
+    assert etag.endswith('-gz"')
+
+    again = client.get("/api/courses/my/enrolled", headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert "Accept-Encoding" in again.headers["Vary"]
+
+
+def test_me_revalidates_from_updated_at(client, make_user, count_queries):
+    _, headers = make_user()
+    etag = client.get("/api/auth/me", headers=headers).headers["ETag"]
+
+    with count_queries() as queries:
+        response = client.get("/api/auth/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert queries["count"] == 1  # the updated_at lookup only
+
+    client.put("/api/auth/profile", json={"bio": "Hello"}, headers=headers)
+    response = client.get("/api/auth/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["user"]["bio"] == "Hello"
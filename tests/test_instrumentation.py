@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine
+
+from app import create_app
+from models.models import db
+from services.instrumentation import instrumentation
+
+HOOKS = (("before_cursor_execute", instrumentation._before_cursor),
+         ("after_cursor_execute", instrumentation._after_cursor),
+         ("handle_error", instrumentation._on_error))
+
+
+@pytest.fixture
+def instrumented(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/test.db",
+        "INSTRUMENTATION_ENABLED": True,
+        "PROFILE_SAMPLE_RATE":     1.0,
+        "PROFILE_DIR":             str(tmp_path / "profiles"),
+        "PROFILE_KEEP":            3,
+    })
+    yield app
+    for name, fn in HOOKS:
+        event.remove(Engine, name, fn)
+    instrumentation.app = None
+
+
+def test_disabled_installs_no_hooks(app, client):
+    # Off means zero overhead: no engine listeners, no request hooks, no timing headers.
+    assert "instrumentation" not in app.extensions
+    assert not any(event.contains(Engine, name, fn) for name, fn in HOOKS)
+    hooks = [f for funcs in app.before_request_funcs.values() for f in funcs]
+    hooks += [f for funcs in app.after_request_funcs.values() for f in funcs]
+    assert not any(getattr(f, "__self__", None) is instrumentation for f in hooks)
+    assert "Server-Timing" not in client.get("/api/health").headers
+
+
+def test_profiles_are_capped(instrumented, tmp_path):
+    client = instrumented.test_client()
+    ids = [client.get("/api/health").headers["X-Profile-Id"] for _ in range(5)]
+    kept = sorted(p.stem for p in (tmp_path / "profiles").glob("*.prof"))
+    assert kept == sorted(ids[-3:])
+
+
+def test_failed_statement_leaves_no_start_time(instrumented):
+    with instrumented.app_context(), db.engine.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_start"] == []
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from models.models import db, Course, Enrollment, Certificate
+from services.progress_buffer import progress_buffer
+
+
+@pytest.fixture
+def buffered(app, make_user, make_courses, monkeypatch):
+    monkeypatch.setattr(progress_buffer, "enabled", True)
+    monkeypatch.setattr(progress_buffer, "_pid", os.getpid())  # no flusher thread; tests flush by hand
+    monkeypatch.setattr(progress_buffer, "_buffer", {})
+    monkeypatch.setattr(progress_buffer, "_targets", {})
+    user, headers = make_user()
+    course_id = make_courses(1, total_lessons=10)[0].id
+    db.session.add(Enrollment(user_id=user.id, course_id=course_id))
+    db.session.commit()
+    return course_id, headers
+
+
+def _beat(client, course_id, headers, **data):
+    return client.put(f"/api/courses/{course_id}/progress", json=data, headers=headers)
+
+
+def _stored(course_id):
+    db.session.expire_all()
+    e = Enrollment.query.filter_by(course_id=course_id).one()
+    return e.lessons_completed, e.time_spent_minutes, e.progress_percent
+
+
+def test_heartbeats_coalesce_to_the_highest_values(client, buffered):
+    course_id, headers = buffered
+    assert _beat(client, course_id, headers, lessons_completed=3, time_spent_minutes=5).status_code == 202
+    assert _beat(client, course_id, headers, lessons_completed=2, time_spent_minutes=9).status_code == 202
+    assert _stored(course_id) == (0, 0, 0.0)
+
+    progress_buffer.flush()
+    assert _stored(course_id) == (3, 9, 30.0)
+
+
+def test_flush_never_lowers_stored_values(client, buffered):
+    course_id, headers = buffered
+    _beat(client, course_id, headers, lessons_completed=1, time_spent_minutes=1)
+    # Meanwhile another worker already wrote further progress.
+    Enrollment.query.filter_by(course_id=course_id).update(
+        {"lessons_completed": 5, "time_spent_minutes": 50, "progress_percent": 50.0})
+    db.session.commit()
+
+    progress_buffer.flush()
+    assert _stored(course_id) == (5, 50, 50.0)
+
+
+def test_failed_flush_requeues_and_merges(client, buffered, monkeypatch):
+    course_id, headers = buffered
+    _beat(client, course_id, headers, lessons_completed=2, time_spent_minutes=20)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database down")
+    with monkeypatch.context() as patched, pytest.raises(RuntimeError):
+        patched.setattr(db.session, "execute", fail)
+        progress_buffer.flush()
+
+    _beat(client, course_id, headers, lessons_completed=4, time_spent_minutes=10)
+    progress_buffer.flush()
+    assert _stored(course_id) == (4, 20, 40.0)
+
+
+def test_completion_issues_exactly_one_certificate(client, buffered):
+    course_id, headers = buffered
+    _beat(client, course_id, headers, lessons_completed=9)
+    assert _beat(client, course_id, headers, lessons_completed=10).status_code == 200
+
+    # Another worker whose cached target still says "not completed".
+    for target in progress_buffer._targets.values():
+        target["completed"] = False
+    assert _beat(client, course_id, headers, lessons_completed=10).status_code == 200
+    # And a late heartbeat on this worker is just buffered.
+    assert _beat(client, course_id, headers, lessons_completed=10).status_code == 202
+    progress_buffer.flush()
+
+    db.session.expire_all()
+    assert Certificate.query.filter_by(course_id=course_id).count() == 1
+    assert db.session.get(Course, course_id).completion_count == 1
+    assert _stored(course_id) == (10, 0, 100.0)
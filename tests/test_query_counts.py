@@ -0,0 +1,26 @@
+import pytest
+
+from models.models import db, Enrollment, Certificate
+
+
+def _enroll(user_id, course_ids):
+    for course_id in course_ids:
+        db.session.add(Enrollment(user_id=user_id, course_id=course_id))
+        db.session.add(Certificate(user_id=user_id, course_id=course_id,
+                                   certificate_code=f"NL-{user_id}-{course_id}"))
+    db.session.commit()
+    db.session.expunge_all()  # nothing preloaded in the identity map
+
+
+@pytest.mark.parametrize("path", ["/api/courses/my/enrolled", "/api/dashboard/stats"])
+def test_query_count_does_not_grow_with_enrollments(client, make_user, make_courses, count_queries, path):
+    course_ids = [c.id for c in make_courses(50)]
+    counts  = []
+    for n in (1, 50):
+        user, headers = make_user(f"learner{n}@example.com")
+        _enroll(user.id, course_ids[:n])
+        with count_queries() as queries:
+            response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        counts.append(queries["count"])
+    assert counts[0] == counts[1]
@@ -0,0 +1,55 @@
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from models.models import db, Certificate, ContactMessage
+from routes.courses import SORT_MAP
+
+FULL_SCAN = re.compile(r"\bSCAN (courses|certificates|contact_messages)$")
+
+
+def _plans(run):
+    """Run `run()`, then EXPLAIN QUERY PLAN every SELECT it issued."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert statements
+    with db.engine.connect() as conn:
+        return [(statement, [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)])
+                for statement, parameters in statements]
+
+
+def _assert_indexed(plans):
+    for statement, plan in plans:
+        assert not any(FULL_SCAN.search(step) for step in plan), f"full scan:\n{statement}\n{plan}"
+
+
+@pytest.mark.parametrize("category", ["", "tech"])
+@pytest.mark.parametrize("sort", sorted(SORT_MAP))
+@pytest.mark.parametrize("mode", [{}, {"cursor": ""}])
+def test_catalog_queries_use_indexes(client, make_courses, sort, category, mode):
+    make_courses(5)
+    query = dict(sort=sort, category=category, **mode)
+    _assert_indexed(_plans(lambda: client.get("/api/courses/", query_string=query)))
+
+
+def test_certificates_by_user_use_index(app, make_user):
+    user, _ = make_user()
+    _assert_indexed(_plans(lambda: Certificate.for_user(user.id).all()))
+
+
+def test_contact_by_created_at_uses_index(app):
+    since = datetime(2026, 1, 1)
+    _assert_indexed(_plans(lambda: db.session.execute(
+        db.select(ContactMessage).where(ContactMessage.created_at >= since).order_by(ContactMessage.created_at)
+    ).all()))
@@ -0,0 +1,81 @@
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from app import create_app
+from models.migrations import run_migrations
+from models.models import db, User, Course
+from services.catalog_cache import MemoryBackend
+from services.replicas import replicas
+
+# Two local SQLite files stand in for the primary and its replica. They are
+# never synchronised, so each response shows which database served it.
+
+
+def _course(slug):
+    return dict(title=slug, slug=slug, instructor="Teacher", category="tech")
+
+
+@pytest.fixture
+def routed(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/primary.db",
+        "SQLALCHEMY_REPLICA_URIS": [f"sqlite:///{tmp_path}/replica.db"],
+        "CATALOG_CACHE_BACKEND":   "none",
+    })
+    with app.app_context():
+        db.create_all()
+        run_migrations()
+        db.metadata.create_all(replicas.engines[0])
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+        db.session.add(user)
+        db.session.execute(insert(Course), [_course("on-primary")])
+        db.session.commit()
+        with replicas.engines[0].begin() as conn:
+            conn.execute(insert(User.__table__), [dict(id=user.id, first_name="Ann", last_name="Lee",
+                                                      email="ann@example.com", password_hash="x")])
+            conn.execute(insert(Course.__table__), [_course("on-replica")])
+        headers = {"Authorization": f"Bearer {create_access_token(identity=str(user.id))}"}
+        yield app, headers
+        db.session.remove()
+    replicas.engines = []
+
+
+def _slugs(response):
+    return [c["slug"] for c in response.get_json()["courses"]]
+
+
+def test_reads_go_to_the_replica(routed):
+    app, _ = routed
+    assert _slugs(app.test_client().get("/api/courses/")) == ["on-replica"]
+
+
+def test_writes_pin_reads_to_the_primary_on_any_worker(routed):
+    app, headers = routed
+    client = app.test_client()
+    course_id = db.session.execute(db.select(Course.id).where(Course.slug == "on-primary")).scalar()
+    assert client.post(f"/api/courses/{course_id}/enroll", headers=headers).status_code == 201
+
+    # Another gunicorn worker: its per-process pin store never saw the write.
+    replicas.pins = MemoryBackend(ttl=replicas.pin_seconds)
+    enrolled = client.get("/api/courses/my/enrolled", headers=headers).get_json()["enrollments"]
+    assert [e["course"]["slug"] for e in enrolled] == ["on-primary"]
+
+    # A client without the pin cookie is still served by the replica.
+    other = app.test_client().get("/api/courses/my/enrolled", headers=headers)
+    assert other.get_json()["enrollments"] == []
+
+
+def test_forged_pin_cookie_is_ignored(routed):
+    app, headers = routed
+    client = app.test_client()
+    client.set_cookie("db_pin", "1.forged.signature")
+    assert client.get("/api/courses/my/enrolled", headers=headers).get_json()["enrollments"] == []
+
+
+def test_failed_replica_falls_back_to_primary(routed, tmp_path):
+    app, _ = routed
+    with replicas.engines[0].begin() as conn:
+        conn.exec_driver_sql("DROP TABLE courses")
+    assert _slugs(app.test_client().get("/api/courses/")) == ["on-primary"]
+    assert replicas.healthy() == []
@@ -0,0 +1,65 @@
+from sqlalchemy.dialects import mysql
+
+from models.models import db, Course
+from services.search import InvertedIndex, _mysql_search, search_index
+
+ROWS = [
+    (1, "Python for Data Science", "Sarah Chen"),
+    (2, "Advanced Pythonic Patterns", "Mark Python"),
+    (3, "Data Engineering", "Priya Sharma"),
+]
+
+
+def _index():
+    index = InvertedIndex()
+    index.build(ROWS)
+    return index
+
+
+def test_title_matches_outrank_instructor_matches():
+    assert [cid for cid, _ in _index().search("python")] == [1, 2]
+
+
+def test_exact_token_outranks_prefix_match():
+    index = InvertedIndex()
+    index.build([(1, "Pythonic", ""), (2, "Python", "")])
+    assert [cid for cid, _ in index.search("python")] == [2, 1]
+
+
+def test_prefixes_match_and_all_tokens_are_required():
+    index = _index()
+    assert {cid for cid, _ in index.search("dat")} == {1, 3}
+    assert [cid for cid, _ in index.search("data py")] == [1]
+    assert index.search("data rust") == []
+
+
+def test_index_refreshes_on_catalog_version_bump(app, make_courses):
+    make_courses(1)
+    search_index.version = None  # the module-level index outlives each test's database
+    search_index.refresh()
+    assert search_index.search("rust") == []
+
+    db.session.add(Course(title="Rust in Practice", slug="rust", instructor="Teacher", category="tech"))
+    db.session.commit()  # bumps the catalog version
+    search_index.refresh()
+    assert [cid for cid, _ in search_index.search("rust")]
+
+
+def test_sqlite_fallback_ranks_catalog_search(client, make_courses):
+    make_courses(2)
+    db.session.add(Course(title="Python Course", slug="python", instructor="Teacher", category="tech"))
+    db.session.commit()
+    search_index.version = None  # the module-level index outlives each test's database
+    courses = client.get("/api/courses/", query_string={"search": "cour pyth"}).get_json()["courses"]
+    assert [c["slug"] for c in courses] == ["python"]
+
+
+def test_mysql_short_tokens_fall_back_to_like(app):
+    query, relevance = _mysql_search(Course.query, ["ai", "python"], 3)
+    sql = str(query.statement.compile(dialect=mysql.dialect()))
+    assert "MATCH (courses.title, courses.instructor) AGAINST" in sql
+    assert "LIKE" in sql and relevance is not None
+
+    query, relevance = _mysql_search(Course.query, ["ux"], 3)
+    assert "MATCH" not in str(query.statement.compile(dialect=mysql.dialect()))
+    assert relevance is None
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app import create_app
+from bench.bench_startup import PROBE
+from commands import DEMO_COURSES
+from models.migrations import MIGRATIONS, schema_migrations
+from models.models import db, Course
+from services.readiness import readiness
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def fresh_probe():
+    readiness._checked = float("-inf")  # module-level, shared by every test app
+    yield
+    readiness._checked = float("-inf")
+
+
+def test_import_opens_no_database_connections(tmp_path):
+    database = tmp_path / "never-created.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{database}", CONTACT_QUEUE_ENABLED="false")
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True, timeout=60)
+    _, connects = out.stdout.split()[-2:]
+    assert int(connects) == 0
+    assert not database.exists()
+
+
+def test_readiness_probe_is_cached(app, client, count_queries):
+    app.config["READINESS_CACHE_SECONDS"] = 60
+    readiness.init_app(app)
+    with count_queries() as n:
+        assert client.get("/api/health/ready").json == {"status": "ready"}
+        assert client.get("/api/health/ready").status_code == 200
+    assert n["count"] == 1
+
+
+def test_readiness_is_503_when_database_is_down(tmp_path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/missing/dir/app.db",
+                      "TESTING": True})
+    client = app.test_client()
+    response = client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json == {"status": "unavailable"}
+    assert client.get("/api/health/live").status_code == 200  # liveness never touches the DB
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_init_db_creates_schema_and_seeds_once(tmp_path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/fresh.db", "TESTING": True})
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["init-db"])
+    assert result.exit_code == 0, result.output
+    assert f"Seeded {len(DEMO_COURSES)} courses" in result.output
+
+    result = runner.invoke(args=["init-db"])
+    assert result.exit_code == 0, result.output
+    assert "already seeded" in result.output
+
+    with app.app_context():
+        assert Course.query.count() == len(DEMO_COURSES)
+        applied = db.session.scalars(db.select(schema_migrations.c.version)).all()
+        assert sorted(applied) == sorted(version for version, _, _ in MIGRATIONS)
+        db.session.remove()
+        db.engine.dispose()